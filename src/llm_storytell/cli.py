@@ -1,130 +1,269 @@
 """Command-line interface for llm_storytell."""
 
-import argparse
+from __future__ import annotations
+
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 
-from llm_storytell.config import (
-    AppConfigError,
-    AppNotFoundError,
-    AppPaths,
-    load_app_config,
-    resolve_app,
-)
-from llm_storytell.iso639 import InvalidLanguageError, validate_iso639
-from llm_storytell.logging import RunLogger
-from llm_storytell.pipeline.resolve import resolve_run_settings
-from llm_storytell.pipeline.runner import run_pipeline
+if TYPE_CHECKING:
+    import argparse
 
+    from llm_storytell.config import AppPaths
+    from llm_storytell.pipeline.resolve import RunSettings
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser for the CLI."""
-    parser = argparse.ArgumentParser(
-        prog="llm_storytell",
-        description="A deterministic content generation pipeline for narrative text.",
-    )
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+# Subcommands known to the parser; used to build only the one being invoked.
+_SUBCOMMANDS = ("run", "audio-prep")
 
-    # 'run' subcommand
-    run_parser = subparsers.add_parser(
-        "run", help="Run the content generation pipeline"
-    )
-    run_parser.add_argument(
+# Top-level help, identical to create_parser().format_help() at 80 columns.
+# Printed for bare/-h/--help invocations without building the parser; a test
+# keeps it in sync with the argparse definitions.
+_HELP_TEXT = """\
+usage: llm_storytell [-h] {run,audio-prep} ...
+
+A deterministic content generation pipeline for narrative text.
+
+positional arguments:
+  {run,audio-prep}  Available commands
+    run             Run the content generation pipeline
+    audio-prep      Re-run audio-prep on an existing run (requires
+                    tts/outputs/ segment files).
+
+options:
+  -h, --help        show this help message and exit
+"""
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return argv[0] if it names a known subcommand, else None.
+
+    Only the first token can select the subcommand; anything else (an
+    unknown command, a leading option) needs the full parser so argparse
+    reports the error against every available choice.
+    """
+    if argv and argv[0] in _SUBCOMMANDS:
+        return argv[0]
+    return None
+
+
+class CLIError(Exception):
+    """Raised when the fast 'run' parser cannot handle argv.
+
+    The caller falls back to argparse, which produces the user-facing
+    error message (or help output).
+    """
+
+    pass
+
+
+# Options of the 'run' subcommand: (flag, add_argument kwargs). Single source
+# for _add_run_parser and the fast parse_run_args path.
+_RUN_OPTIONS: tuple[tuple[str, dict[str, Any]], ...] = (
+    (
         "--app",
-        required=True,
-        help="Name of the app to run (requires apps/<app>/context/)",
-    )
-    run_parser.add_argument(
+        {
+            "required": True,
+            "help": "Name of the app to run (requires apps/<app>/context/)",
+        },
+    ),
+    (
         "--seed",
-        required=False,
-        help="Short natural-language description of the story (2-3 sentences)",
-    )
-    run_parser.add_argument(
+        {"help": "Short natural-language description of the story (2-3 sentences)"},
+    ),
+    (
         "--beats",
-        type=int,
-        required=False,
-        help="Number of outline beats (1-20, default: app-defined)",
-    )
-    run_parser.add_argument(
+        {"help": "Number of outline beats (1-20, default: app-defined)"},
+    ),
+    (
         "--sections",
-        type=int,
-        required=False,
-        help="Alias for --beats (one section per beat)",
-    )
-    run_parser.add_argument(
+        {"help": "Alias for --beats (one section per beat)"},
+    ),
+    (
         "--run-id",
-        required=False,
-        help="Optional run ID override (default: run-YYYYMMDD-HHMMSS)",
-    )
-    run_parser.add_argument(
+        {"help": "Optional run ID override (default: run-YYYYMMDD-HHMMSS)"},
+    ),
+    (
         "--config-path",
-        type=Path,
-        default=Path("config/"),
-        help="Path to configuration directory (default: config/)",
-    )
-    run_parser.add_argument(
+        {
+            "default": "config/",
+            "help": "Path to configuration directory (default: config/)",
+        },
+    ),
+    (
         "--model",
-        required=False,
-        help="Model identifier for all LLM calls in this run (default: gpt-4.1-mini). Fails immediately if the provider does not recognize the model.",
-    )
-    run_parser.add_argument(
+        {
+            "help": "Model identifier for all LLM calls in this run (default: gpt-4.1-mini). Fails immediately if the provider does not recognize the model."
+        },
+    ),
+    (
         "--llm-provider",
-        dest="llm_provider",
-        required=False,
-        help="Text LLM provider: openai or claude. Overrides app config. Resolution: CLI → app_config.yaml → default_config.yaml.",
-    )
-    run_parser.add_argument(
+        {
+            "dest": "llm_provider",
+            "help": "Text LLM provider: openai or claude. Overrides app config. Resolution: CLI → app_config.yaml → default_config.yaml.",
+        },
+    ),
+    (
         "--section-length",
-        type=int,
-        required=False,
-        metavar="N",
-        help="Target words per section; pipeline uses range [N*0.8, N*1.2]. Overrides app config when set.",
-    )
-    run_parser.add_argument(
+        {
+            "metavar": "N",
+            "help": "Target words per section; pipeline uses range [N*0.8, N*1.2]. Overrides app config when set.",
+        },
+    ),
+    (
         "--word-count",
-        type=int,
-        required=False,
-        metavar="N",
-        help="Target total word count for the story (100 < N < 15000). Derives beat count and section length; see SPEC.",
-    )
-    run_parser.add_argument(
+        {
+            "metavar": "N",
+            "help": "Target total word count for the story (100 < N < 15000). Derives beat count and section length; see SPEC.",
+        },
+    ),
+    (
         "--tts",
-        action="store_true",
-        help="Enable TTS (text-to-speech) after critic step (default).",
-    )
-    run_parser.add_argument(
+        {
+            "action": "store_true",
+            "help": "Enable TTS (text-to-speech) after critic step (default).",
+        },
+    ),
+    (
         "--no-tts",
-        action="store_true",
-        help="Disable TTS; pipeline ends after critic step.",
-    )
-    run_parser.add_argument(
+        {
+            "action": "store_true",
+            "help": "Disable TTS; pipeline ends after critic step.",
+        },
+    ),
+    (
         "--tts-provider",
-        required=False,
-        help="TTS provider (e.g. openai, elevenlabs). Overrides app config.",
-    )
-    run_parser.add_argument(
+        {"help": "TTS provider (e.g. openai, elevenlabs). Overrides app config."},
+    ),
+    (
         "--tts-model",
-        required=False,
-        help="TTS model (e.g. gpt-4o-mini-tts, eleven_multilingual_v2). Default depends on provider.",
-    )
-    run_parser.add_argument(
+        {
+            "help": "TTS model (e.g. gpt-4o-mini-tts, eleven_multilingual_v2). Default depends on provider."
+        },
+    ),
+    (
         "--tts-voice",
-        required=False,
-        help="TTS voice (e.g. Onyx for OpenAI, or voice_id for ElevenLabs). Default depends on provider.",
-    )
-    run_parser.add_argument(
+        {
+            "help": "TTS voice (e.g. Onyx for OpenAI, or voice_id for ElevenLabs). Default depends on provider."
+        },
+    ),
+    (
         "--language",
-        required=False,
-        metavar="CODE",
-        help="ISO 639-1 language code for story output (e.g. en, es). Overrides app config.",
-    )
-    run_parser.add_argument(
+        {
+            "metavar": "CODE",
+            "help": "ISO 639-1 language code for story output (e.g. en, es). Overrides app config.",
+        },
+    ),
+    (
         "--delivery",
-        action="store_true",
-        help="After a successful run, send the runs/book deliverable to Telegram (requires TELEGRAM_BOT_API_TOKEN and TELEGRAM_RECEIVER_ID in creds.json).",
+        {
+            "action": "store_true",
+            "help": "After a successful run, send the runs/book deliverable to Telegram (requires TELEGRAM_BOT_API_TOKEN and TELEGRAM_RECEIVER_ID in creds.json).",
+        },
+    ),
+)
+# Value options (both parsers keep the raw strings; _coerce_run_args
+# converts them once) and boolean store_true options.
+_RUN_VALUE_OPTIONS = tuple(
+    flag for flag, kwargs in _RUN_OPTIONS if kwargs.get("action") != "store_true"
+)
+_RUN_FLAG_OPTIONS = tuple(
+    flag for flag, kwargs in _RUN_OPTIONS if kwargs.get("action") == "store_true"
+)
+# Value options converted to int by _coerce_run_args: flag -> attribute.
+_RUN_INT_OPTIONS = {
+    "--beats": "beats",
+    "--sections": "sections",
+    "--section-length": "section_length",
+    "--word-count": "word_count",
+}
+
+
+def parse_run_args(argv: list[str]) -> SimpleNamespace:
+    """Parse 'run' argv in a single pass without building an argparse parser.
+
+    Produces the same attributes as ``create_parser().parse_args(argv)`` for
+    well-formed input (raw strings; see :func:`_coerce_run_args`), including
+    the ``--option=value`` spelling. Anything
+    unusual (help, unknown or abbreviated flags, missing values, missing
+    --app) raises CLIError so the caller can defer to argparse for the exact
+    error message.
+
+    Args:
+        argv: Arguments starting with the 'run' token.
+
+    Returns:
+        Namespace with ``command="run"`` and one attribute per option.
+
+    Raises:
+        CLIError: If argv is not a well-formed 'run' invocation.
+    """
+    if not argv or argv[0] != "run":
+        raise CLIError("expected 'run' subcommand first")
+
+    values: dict[str, Any] = {
+        flag[2:].replace("-", "_"): kwargs.get(
+            "default", False if kwargs.get("action") == "store_true" else None
+        )
+        for flag, kwargs in _RUN_OPTIONS
+    }
+
+    tokens = iter(argv[1:])
+    for tok in tokens:
+        if tok in _RUN_FLAG_OPTIONS:
+            values[tok[2:].replace("-", "_")] = True
+            continue
+        tok, sep, value = tok.partition("=")
+        if tok not in _RUN_VALUE_OPTIONS:
+            raise CLIError(f"unrecognized argument: {tok}")
+        if not sep:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                raise CLIError(f"{tok} expects a value")
+        values[tok[2:].replace("-", "_")] = value
+
+    if values["app"] is None:
+        raise CLIError("--app is required")
+    return SimpleNamespace(command="run", **values)
+
+
+def _coerce_run_args(args: Any) -> str | None:
+    """Convert raw 'run' option strings to their runtime types in place.
+
+    Integer options become ``int`` (or stay None); ``config_path`` becomes a
+    ``Path``.
+
+    Args:
+        args: Parsed 'run' namespace (from either parser).
+
+    Returns:
+        An error message if an integer option is not a valid integer,
+        otherwise None.
+    """
+    for flag, attr in _RUN_INT_OPTIONS.items():
+        raw = getattr(args, attr)
+        if raw is None:
+            continue
+        try:
+            setattr(args, attr, int(raw))
+        except ValueError:
+            return f"{flag} must be an integer (got {raw!r})"
+    args.config_path = Path(args.config_path)
+    return None
+
+
+def _add_run_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the 'run' subcommand and its arguments (from _RUN_OPTIONS)."""
+    run_parser = subparsers.add_parser(
+        "run", help="Run the content generation pipeline"
     )
+    for flag, kwargs in _RUN_OPTIONS:
+        run_parser.add_argument(flag, **kwargs)
 
+
+def _add_audio_prep_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Add the 'audio-prep' subcommand and its arguments."""
     audio_prep_parser = subparsers.add_parser(
         "audio-prep",
         help="Re-run audio-prep on an existing run (requires tts/outputs/ segment files).",
@@ -136,6 +275,29 @@ def create_parser() -> argparse.ArgumentParser:
         help="Path to the run directory (e.g. runs/run-20260325-000115).",
     )
 
+
+def create_parser(subcommand: str | None = None) -> argparse.ArgumentParser:
+    """Create the argument parser for the CLI.
+
+    Args:
+        subcommand: If set, only this subcommand's parser is built (its
+            arguments are not needed for any other invocation). If None,
+            all subcommands are added.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="llm_storytell",
+        description="A deterministic content generation pipeline for narrative text.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    if subcommand in (None, "run"):
+        _add_run_parser(subparsers)
+    if subcommand in (None, "audio-prep"):
+        _add_audio_prep_parser(subparsers)
+
     return parser
 
 
@@ -152,6 +314,8 @@ def resolve_app_or_exit(app_name: str, base_dir: Path | None = None) -> AppPaths
     Exits:
         With code 1 if app resolution fails.
     """
+    from llm_storytell.config import AppNotFoundError, resolve_app
+
     try:
         return resolve_app(app_name, base_dir)
     except AppNotFoundError as e:
@@ -159,6 +323,17 @@ def resolve_app_or_exit(app_name: str, base_dir: Path | None = None) -> AppPaths
         sys.exit(1)
 
 
+def run_pipeline(settings: RunSettings) -> int:
+    """Run the pipeline (imports the runner, steps and HTTP clients on first use).
+
+    Kept out of module scope so ``--help`` and argument errors do not pay for
+    importing the provider SDKs and every step module.
+    """
+    from llm_storytell.pipeline.runner import run_pipeline as _run_pipeline
+
+    return _run_pipeline(settings)
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI.
 
@@ -168,32 +343,37 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure).
     """
-    parser = create_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv or argv[0] in ("-h", "--help"):
+        sys.stdout.write(_HELP_TEXT)
+        return 0
+    subcommand = _sniff_subcommand(argv)
+    args: Any = None
+    if subcommand == "run":
+        try:
+            args = parse_run_args(argv)
+        except CLIError:
+            args = None
+    if args is None:
+        args = create_parser(subcommand).parse_args(argv)
 
     if args.command is None:
-        parser.print_help()
+        create_parser().print_help()
         return 0
 
     if args.command == "run":
+        coerce_error = _coerce_run_args(args)
+        if coerce_error is not None:
+            print(f"Error: {coerce_error}", file=sys.stderr)
+            return 1
         if not args.seed:
             print("Error: --seed is required for 'run' command", file=sys.stderr)
-            parser.print_help()
-            return 1
-
-        base_dir = Path.cwd()
-        app_paths = resolve_app_or_exit(args.app, base_dir)
-
-        try:
-            app_config = load_app_config(
-                app_paths.app_name,
-                base_dir=base_dir,
-                app_root=app_paths.app_root,
-            )
-        except AppConfigError as e:
-            print(f"Error: {e}", file=sys.stderr)
+            sys.stdout.write(_HELP_TEXT)
             return 1
 
+        # Argument-only checks first: bad input fails before any app or
+        # config files are read.
         beats = args.beats
         if args.sections is not None:
             if beats is not None:
@@ -237,11 +417,7 @@ def main(argv: list[str] | None = None) -> int:
             )
             return 1
 
-        tts_enabled = not getattr(args, "no_tts", False)
-        tts_provider_cli = getattr(args, "tts_provider", None)
-        tts_provider = tts_provider_cli or app_config.tts_provider
-        tts_voice = getattr(args, "tts_voice", None)
-        tts_model = getattr(args, "tts_model", None)
+        from llm_storytell.iso639 import InvalidLanguageError, validate_iso639
 
         language_arg = getattr(args, "language", None)
         if language_arg is not None:
@@ -254,6 +430,28 @@ def main(argv: list[str] | None = None) -> int:
                 )
                 return 1
 
+        from llm_storytell.config import AppConfigError, load_app_config
+        from llm_storytell.pipeline.resolve import resolve_run_settings
+
+        base_dir = Path.cwd()
+        app_paths = resolve_app_or_exit(args.app, base_dir)
+
+        try:
+            app_config = load_app_config(
+                app_paths.app_name,
+                base_dir=base_dir,
+                app_root=app_paths.app_root,
+            )
+        except AppConfigError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        tts_enabled = not getattr(args, "no_tts", False)
+        tts_provider_cli = getattr(args, "tts_provider", None)
+        tts_provider = tts_provider_cli or app_config.tts_provider
+        tts_voice = getattr(args, "tts_voice", None)
+        tts_model = getattr(args, "tts_model", None)
+
         settings = resolve_run_settings(
             app_paths,
             app_config,
@@ -278,6 +476,7 @@ def main(argv: list[str] | None = None) -> int:
         return run_pipeline(settings)
 
     if args.command == "audio-prep":
+        from llm_storytell.logging import RunLogger
         from llm_storytell.steps.audio_prep import (
             AudioPrepStepError,
             execute_audio_prep_step,
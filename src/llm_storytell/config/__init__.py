@@ -1,7 +1,35 @@
-"""Configuration module for llm_storytell."""
+"""Configuration module for llm_storytell.
 
-from llm_storytell.config.app_config import AppConfig, AppConfigError, load_app_config
-from llm_storytell.config.app_resolver import AppNotFoundError, AppPaths, resolve_app
+Public names are resolved lazily (PEP 562) so importing the package does not
+import every submodule.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from llm_storytell.config.app_config import (
+        AppConfig,
+        AppConfigError,
+        load_app_config,
+    )
+    from llm_storytell.config.app_resolver import (
+        AppNotFoundError,
+        AppPaths,
+        resolve_app,
+    )
+
+# Public name -> submodule defining it.
+_LAZY_ATTRS = {
+    "AppConfig": "app_config",
+    "AppConfigError": "app_config",
+    "load_app_config": "app_config",
+    "AppNotFoundError": "app_resolver",
+    "AppPaths": "app_resolver",
+    "resolve_app": "app_resolver",
+}
 
 __all__ = [
     "AppConfig",
@@ -11,3 +39,16 @@ __all__ = [
     "load_app_config",
     "resolve_app",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
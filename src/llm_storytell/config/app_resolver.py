@@ -5,8 +5,9 @@ Only apps/<app_name>/ is used: context from apps/<app_name>/context/,
 prompts from apps/<app_name>/prompts/ if present, else prompts/app-defaults/.
 """
 
-from dataclasses import dataclass
+import os
 from pathlib import Path
+from typing import NamedTuple
 
 
 class AppNotFoundError(Exception):
@@ -15,9 +16,8 @@ class AppNotFoundError(Exception):
     pass
 
 
-@dataclass(frozen=True)
-class AppPaths:
-    """Resolved paths for an app.
+class AppPaths(NamedTuple):
+    """Resolved paths for an app (immutable).
 
     Attributes:
         app_name: The name of the app.
@@ -39,6 +39,9 @@ def resolve_app(app_name: str, base_dir: Path | None = None) -> AppPaths:
     - apps/<app_name>/context/lore_bible.md must exist.
     - Prompts from apps/<app_name>/prompts/ if present, else prompts/app-defaults/.
 
+    base_dir is made absolute lexically (``os.path.abspath``), not via
+    ``Path.resolve()``, so symlinks in it are kept as given.
+
     Args:
         app_name: The name of the app to resolve.
         base_dir: The base directory of the project. If None, uses current working
@@ -50,35 +53,28 @@ def resolve_app(app_name: str, base_dir: Path | None = None) -> AppPaths:
     Raises:
         AppNotFoundError: If apps/<app_name>/context/lore_bible.md does not exist.
     """
-    if not app_name or not app_name.strip():
+    if not (app_name := (app_name or "").strip()):
         raise AppNotFoundError("App name cannot be empty.")
 
-    app_name = app_name.strip()
-
-    if base_dir is None:
-        base_dir = Path.cwd()
-
-    base_dir = base_dir.resolve()
-
-    apps_context = base_dir / "apps" / app_name / "context"
-    lore_bible = apps_context / "lore_bible.md"
-    if not lore_bible.exists():
+    base_dir_str = os.getcwd() if base_dir is None else os.path.abspath(base_dir)
+    app_root = os.path.join(base_dir_str, "apps", app_name)
+    apps_context = os.path.join(app_root, "context")
+    if not os.path.exists(os.path.join(apps_context, "lore_bible.md")):
         raise AppNotFoundError(
             f"App '{app_name}' not found. Create apps/{app_name}/context/lore_bible.md "
             f"(and at least one character file in apps/{app_name}/context/characters/) "
-            f"under: {base_dir}"
+            f"under: {Path(base_dir_str).resolve()}"
         )
 
-    app_root = base_dir / "apps" / app_name
-    prompts_in_app = app_root / "prompts"
-    if prompts_in_app.is_dir():
+    prompts_in_app = os.path.join(app_root, "prompts")
+    if os.path.isdir(prompts_in_app):
         prompts_dir = prompts_in_app
     else:
-        prompts_dir = base_dir / "prompts" / "app-defaults"
+        prompts_dir = os.path.join(base_dir_str, "prompts", "app-defaults")
 
     return AppPaths(
         app_name=app_name,
-        context_dir=apps_context,
-        prompts_dir=prompts_dir,
-        app_root=app_root,
+        context_dir=Path(apps_context),
+        prompts_dir=Path(prompts_dir),
+        app_root=Path(app_root),
     )
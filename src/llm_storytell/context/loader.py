@@ -5,6 +5,7 @@ so the same run_id reproduces the same selection).
 """
 
 import hashlib
+import os
 import random
 from dataclasses import dataclass
 from pathlib import Path
@@ -76,10 +77,15 @@ class ContextSelection:
     world_files: list[str]
 
 
-def _seed_from_run_id(run_id: str) -> None:
-    """Seed the random module from run_id for reproducible per-run selection."""
-    seed = int(hashlib.md5(run_id.encode()).hexdigest()[:8], 16)
-    random.seed(seed)
+def _rng_from_run_id(run_id: str) -> random.Random:
+    """Return a generator seeded from run_id for reproducible per-run selection.
+
+    The seed is the first 4 bytes of the run_id's MD5 digest (big-endian),
+    read straight from the digest; kept as-is so a run_id selects the same
+    context as in earlier releases.
+    """
+    digest = hashlib.md5(run_id.encode()).digest()
+    return random.Random(int.from_bytes(digest[:4], "big"))
 
 
 class ContextLoader:
@@ -155,13 +161,13 @@ class ContextLoader:
         always_loaded = self._load_lore_and_style()
         world_files = always_loaded.pop("_world_files", [])
 
-        _seed_from_run_id(run_id)
+        rng = _rng_from_run_id(run_id)
 
         # Random: one location when max_locations >= 1
-        selected_location, location_content = self._select_location()
+        selected_location, location_content = self._select_location(rng)
 
         # Random: up to _max_characters characters (at least one required)
-        selected_characters, character_contents = self._select_characters()
+        selected_characters, character_contents = self._select_characters(rng)
 
         if self.logger:
             self.logger.log_context_selection(
@@ -206,18 +212,27 @@ class ContextLoader:
             raise ContextLoaderError(
                 f"Required file not found: {lore_bible_path.relative_to(self.context_dir)}"
             )
-        lore_content = self._read_file(lore_bible_path)
 
-        # World: load all world/*.md in alphabetical order (only if include_world)
+        # World: all world/*.md in alphabetical order (only if include_world)
         world_dir = self.context_dir / "world"
+        world_paths: list[Path] = []
+        if self._include_world and world_dir.exists() and world_dir.is_dir():
+            world_paths = _list_markdown_files(world_dir)
+        style_dir = self.context_dir / "style"
+        style_paths: list[Path] = []
+        if style_dir.exists() and style_dir.is_dir():
+            style_paths = _list_markdown_files(style_dir)
+
+        # Read lore, world and style files in one batch
+        texts = iter(self._read_files([lore_bible_path, *world_paths, *style_paths]))
+        lore_content = next(texts)
+
         world_parts: list[str] = []
         world_files: list[str] = []
-        if self._include_world and world_dir.exists() and world_dir.is_dir():
-            for world_file in sorted(world_dir.glob("*.md")):
-                rel_path = world_file.relative_to(self.context_dir)
-                normalized = self._normalize_path(rel_path)
-                world_files.append(normalized)
-                world_parts.append(self._read_file(world_file))
+        for world_file in world_paths:
+            rel_path = world_file.relative_to(self.context_dir)
+            world_files.append(self._normalize_path(rel_path))
+            world_parts.append(next(texts))
         if world_parts:
             lore_content = (
                 lore_content.rstrip() + WORLD_FOLD_SEPARATOR + "\n\n".join(world_parts)
@@ -226,19 +241,17 @@ class ContextLoader:
         result["_world_files"] = world_files  # consumed by caller
 
         # Style
-        style_dir = self.context_dir / "style"
-        if style_dir.exists() and style_dir.is_dir():
-            for style_file in sorted(style_dir.glob("*.md")):
-                rel_path = style_file.relative_to(self.context_dir)
-                result[self._normalize_path(rel_path)] = self._read_file(style_file)
+        for style_file in style_paths:
+            rel_path = style_file.relative_to(self.context_dir)
+            result[self._normalize_path(rel_path)] = next(texts)
 
         return result
 
-    def _select_location(self) -> tuple[str | None, str | None]:
+    def _select_location(self, rng: random.Random) -> tuple[str | None, str | None]:
         """Select one location file at random when _max_locations >= 1.
 
         When _max_locations is 0, returns (None, None). When >= 1 and locations
-        exist, selects one at random (caller must have seeded random from run_id).
+        exist, selects one at random using rng (seeded from run_id by the caller).
 
         Returns:
             Tuple of (relative_path, content) or (None, None) if no locations or max_locations=0.
@@ -248,21 +261,23 @@ class ContextLoader:
         locations_dir = self.context_dir / "locations"
         if not locations_dir.exists() or not locations_dir.is_dir():
             return (None, None)
-        location_files = sorted(locations_dir.glob("*.md"))
+        location_files = _list_markdown_files(locations_dir)
         if not location_files:
             return (None, None)
-        selected = random.choice(location_files)
+        selected = rng.choice(location_files)
         rel_path = selected.relative_to(self.context_dir)
         normalized = self._normalize_path(rel_path)
         return (normalized, self._read_file(selected))
 
-    def _select_characters(self) -> tuple[list[str], dict[str, str]]:
+    def _select_characters(
+        self, rng: random.Random
+    ) -> tuple[list[str], dict[str, str]]:
         """Select character files at random (up to _max_characters).
 
         When _max_characters is 0, all character files are selected in random order;
         otherwise a random sample of up to _max_characters is chosen (random order). At least one
         character file is required; raises if characters dir is missing or empty.
-        Caller must have seeded random from run_id for reproducibility.
+        rng is seeded from run_id by the caller for reproducibility.
 
         Returns:
             Tuple of (list of relative paths, dict path -> content).
@@ -273,7 +288,7 @@ class ContextLoader:
                 "Required context directory not found or empty: context/<app>/characters/ "
                 "(at least one .md file is required)"
             )
-        character_files = sorted(characters_dir.glob("*.md"))
+        character_files = _list_markdown_files(characters_dir)
         if not character_files:
             raise ContextLoaderError(
                 "No character files found in context/<app>/characters/ "
@@ -281,23 +296,27 @@ class ContextLoader:
             )
         if self._max_characters == 0:
             selected = character_files.copy()
-            random.shuffle(selected)
+            rng.shuffle(selected)
         else:
             n = min(self._max_characters, len(character_files))
-            selected = random.sample(character_files, n)
+            selected = rng.sample(character_files, n)
         selected_paths: list[str] = []
         contents: dict[str, str] = {}
-        for char_file in selected:
+        for char_file, text in zip(selected, self._read_files(selected)):
             rel_path = char_file.relative_to(self.context_dir)
             normalized = self._normalize_path(rel_path)
             selected_paths.append(normalized)
-            contents[normalized] = self._read_file(char_file)
+            contents[normalized] = text
         return (selected_paths, contents)
 
+    def _read_files(self, file_paths: list[Path]) -> list[str]:
+        """Read several files as UTF-8 text, in order."""
+        return [self._read_file(p) for p in file_paths]
+
     def _read_file(self, file_path: Path) -> str:
         """Read a file as UTF-8 text."""
         try:
-            return file_path.read_text(encoding="utf-8")
+            return _read_utf8(file_path)
         except OSError as e:
             raise ContextLoaderError(f"Failed to read {file_path}: {e}") from e
 
@@ -317,6 +336,9 @@ def build_prompt_context_vars(
 
     Returns:
         Dict with keys: lore_bible, style_rules, location_context, character_context.
+
+    Raises:
+        ContextLoaderError: If lore_bible.md is missing or a file cannot be read.
     """
     context_dir = context_dir.resolve()
     selected = state.get("selected_context", {})
@@ -328,46 +350,107 @@ def build_prompt_context_vars(
         raise ContextLoaderError(
             f"Required file not found: {lore_path.relative_to(context_dir)}"
         )
-    lore_content = lore_path.read_text(encoding="utf-8")
+
+    # Collect every file to read first (missing optional files are skipped),
+    # then read them together and assemble in the original order.
+    world_dir = context_dir / "world"
+    world_paths = [
+        p
+        for p in (world_dir / name for name in sorted(selected.get("world_files", [])))
+        if p.exists()
+    ]
+    style_paths = _list_markdown_files(context_dir / "style")
+    location_name = selected.get("location")
+    location_paths: list[Path] = []
+    if location_name:
+        loc_path = context_dir / "locations" / location_name
+        if loc_path.exists():
+            location_paths.append(loc_path)
+    characters_dir = context_dir / "characters"
+    char_entries = [
+        (name, path)
+        for name in selected.get("characters", [])
+        if (path := characters_dir / name).exists()
+    ]
+
+    paths = [lore_path, *world_paths, *style_paths, *location_paths]
+    paths += [path for _, path in char_entries]
+
+    # One handler for the whole batch; steps translate ContextLoaderError
+    try:
+        texts = iter(_read_texts(paths))
+    except OSError as e:
+        raise ContextLoaderError(
+            f"Failed to read {e.filename or context_dir}: {e}"
+        ) from e
 
     # World: fold in alphabetical order with separator (same as loader)
-    world_files = selected.get("world_files", [])
-    if world_files:
-        world_dir = context_dir / "world"
-        parts: list[str] = []
-        for name in sorted(world_files):
-            p = world_dir / name
-            if p.exists():
-                parts.append(p.read_text(encoding="utf-8"))
-        if parts:
-            lore_content = (
-                lore_content.rstrip() + WORLD_FOLD_SEPARATOR + "\n\n".join(parts)
-            )
+    lore_content = next(texts)
+    parts = [next(texts) for _ in world_paths]
+    if parts:
+        lore_content = lore_content.rstrip() + WORLD_FOLD_SEPARATOR + "\n\n".join(parts)
     context_vars["lore_bible"] = lore_content
 
     # Style
-    style_dir = context_dir / "style"
-    style_parts: list[str] = []
-    if style_dir.exists():
-        for f in sorted(style_dir.glob("*.md")):
-            style_parts.append(f"## {f.stem}\n\n{f.read_text(encoding='utf-8')}")
+    style_parts = [f"## {f.stem}\n\n{next(texts)}" for f in style_paths]
     context_vars["style_rules"] = "\n\n".join(style_parts) if style_parts else ""
 
     # Location (optional)
-    location_name = selected.get("location")
-    context_vars["location_context"] = ""
-    if location_name:
-        loc_path = context_dir / "locations" / location_name
-        if loc_path.exists():
-            context_vars["location_context"] = loc_path.read_text(encoding="utf-8")
+    context_vars["location_context"] = next(texts) if location_paths else ""
 
     # Characters (required; state already validated at run start)
-    character_names = selected.get("characters", [])
-    char_parts: list[str] = []
-    for name in character_names:
-        char_path = context_dir / "characters" / name
-        if char_path.exists():
-            char_parts.append(f"## {name}\n\n{char_path.read_text(encoding='utf-8')}")
+    char_parts = [f"## {name}\n\n{next(texts)}" for name, _ in char_entries]
     context_vars["character_context"] = "\n\n".join(char_parts) if char_parts else ""
 
     return context_vars
+
+
+def _read_texts(paths: list[Path]) -> list[str]:
+    """Read UTF-8 text files one after another, in input order.
+
+    Args:
+        paths: Files to read.
+
+    Returns:
+        File contents, one per path, in the same order.
+
+    Raises:
+        OSError: For the first path that cannot be read.
+    """
+    return [_read_utf8(p) for p in paths]
+
+
+def _list_markdown_files(directory: Path) -> list[Path]:
+    """Return the sorted ``*.md`` entries of directory.
+
+    Same result as ``sorted(directory.glob("*.md"))`` (an empty list if the
+    directory is missing or unreadable), listed with one ``os.scandir`` pass
+    that only compares names.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = [
+                e.name for e in entries if os.path.normcase(e.name).endswith(".md")
+            ]
+    except OSError:
+        return []
+    return sorted(directory / name for name in names)
+
+
+def _read_utf8(path: Path) -> str:
+    """Read a UTF-8 text file with one binary read and one decode.
+
+    Same result as ``path.read_text(encoding="utf-8")``, including universal
+    newline translation, without going through a text-mode wrapper.
+
+    Args:
+        path: File to read.
+
+    Returns:
+        Decoded file content with ``\\r\\n`` and ``\\r`` normalized to ``\\n``.
+    """
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
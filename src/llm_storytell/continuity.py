@@ -102,17 +102,19 @@ def merge_continuity_updates(
     keys represent continuity elements (e.g., character states,
     locations, plot threads) and values are their current state.
 
+    The ledger is updated in place, so merging one section's updates
+    costs O(len(updates)) rather than a copy of the whole ledger.
+
     Args:
-        continuity_ledger: Current continuity ledger dictionary.
+        continuity_ledger: Current continuity ledger dictionary
+            (modified in place).
         updates: New continuity updates to merge.
 
     Returns:
-        Updated continuity ledger dictionary (new dict, does not
-        modify input).
+        The updated continuity ledger (the same dict that was passed in).
     """
-    merged = dict(continuity_ledger)
-    merged.update(updates)
-    return merged
+    continuity_ledger.update(updates)
+    return continuity_ledger
 
 
 def get_continuity_context(continuity_ledger: dict[str, str]) -> str:
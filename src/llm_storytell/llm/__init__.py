@@ -14,9 +14,31 @@ Design goals
 
 from __future__ import annotations
 
+import random
+import time
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Callable, Mapping
 
+# Exceptions treated as transient when no provider-specific set is given.
+_TRANSIENT: tuple[type[BaseException], ...] = (TimeoutError, ConnectionError)
+
+# Retry backoff: base * 2**(attempt - 1) seconds, capped, plus random jitter.
+_RETRY_BACKOFF_MAX = 30.0
+_RETRY_JITTER = 0.25
+
+
+def _retry_delay(attempt: int, base: float, rng: random.Random) -> float:
+    """Return the sleep before retry number ``attempt`` (1-based).
+
+    A ``base`` of 0 disables backoff (no sleep, no jitter).
+    """
+    if base <= 0:
+        return 0.0
+    return min(_RETRY_BACKOFF_MAX, base * (2 ** (attempt - 1))) + rng.uniform(
+        0, _RETRY_JITTER
+    )
+
 
 @dataclass
 class LLMResult:
@@ -133,12 +155,26 @@ class OpenAIProvider(LLMProvider):
         }
     """
 
+    # Error-message fragments meaning the requested model is unknown; these
+    # fail immediately instead of being retried.
+    _MODEL_NOT_RECOGNIZED_PHRASES = (
+        "does not exist",
+        "not found",
+        "invalid",
+        "unknown model",
+        "no such model",
+        "model_not_found",
+        "invalid_model",
+    )
+
     def __init__(
         self,
         client: Callable[..., Mapping[str, Any]],
         *,
         default_model: str,
         max_retries: int = 2,
+        retry_on: tuple[type[BaseException], ...] = _TRANSIENT,
+        retry_backoff: float = 0.5,
         **default_params: Any,
     ) -> None:
         """Create a new OpenAI provider.
@@ -156,6 +192,14 @@ class OpenAIProvider(LLMProvider):
                 Number of times to retry a failed call before raising
                 :class:`LLMProviderError`. A value of ``0`` disables
                 retries beyond the first attempt.
+            retry_on:
+                Exception types considered transient and retried. Any
+                other exception raised by ``client`` fails the call
+                immediately.
+            retry_backoff:
+                Base delay in seconds before the first retry; doubled for
+                each further retry (capped at 30s) plus up to 0.25s of
+                jitter. ``0`` retries without sleeping.
             **default_params:
                 Default generation parameters (e.g. ``temperature``)
                 that will be merged with per-call overrides.
@@ -167,7 +211,12 @@ class OpenAIProvider(LLMProvider):
         self._client = client
         self._default_model = default_model
         self._max_retries = max_retries
-        self._default_params = default_params
+        self._retry_on = retry_on
+        self._retry_backoff = retry_backoff
+        self._rng = random.Random()
+        # Read-only so it can be passed through unchanged when a call has no
+        # overrides.
+        self._default_params: Mapping[str, Any] = MappingProxyType(dict(default_params))
 
     def generate(
         self,
@@ -181,23 +230,12 @@ class OpenAIProvider(LLMProvider):
         del step  # not used here but reserved for callers
 
         effective_model = model or self._default_model
-        params: dict[str, Any] = {**self._default_params, **kwargs}
-
-        last_error: Exception | None = None
-        attempts = 0
-        max_attempts = self._max_retries + 1
-
-        _MODEL_NOT_RECOGNIZED_PHRASES = (
-            "does not exist",
-            "not found",
-            "invalid",
-            "unknown model",
-            "no such model",
-            "model_not_found",
-            "invalid_model",
+        params: Mapping[str, Any] = (
+            {**self._default_params, **kwargs} if kwargs else self._default_params
         )
 
-        while attempts < max_attempts:
+        max_attempts = self._max_retries + 1
+        for attempt in range(1, max_attempts + 1):
             try:
                 response = self._client(
                     prompt=prompt,
@@ -206,24 +244,22 @@ class OpenAIProvider(LLMProvider):
                 )
                 break
             except Exception as exc:  # pragma: no cover - exercised via tests
-                last_error = exc
                 msg_lower = str(exc).lower()
-                if any(phrase in msg_lower for phrase in _MODEL_NOT_RECOGNIZED_PHRASES):
+                if any(
+                    phrase in msg_lower for phrase in self._MODEL_NOT_RECOGNIZED_PHRASES
+                ):
                     raise LLMProviderError(
                         f"Provider API does not identify requested model: {effective_model}. {exc!s}"
                     ) from exc
-                attempts += 1
-                if attempts >= max_attempts:
-                    msg = (
-                        f"OpenAI call failed after {attempts} attempts: {last_error!s}"
-                    )
-                    raise LLMProviderError(msg) from last_error
-        else:  # pragma: no cover - defensive, loop always breaks or raises
-            msg = f"OpenAI call failed after {attempts} attempts: {last_error!s}"
-            raise LLMProviderError(msg) from last_error
+                if not isinstance(exc, self._retry_on):
+                    raise LLMProviderError(f"OpenAI call failed: {exc!s}") from exc
+                if attempt == max_attempts:
+                    msg = f"OpenAI call failed after {attempt} attempts: {exc!s}"
+                    raise LLMProviderError(msg) from exc
+                time.sleep(_retry_delay(attempt, self._retry_backoff, self._rng))
 
         content, prompt_tokens, completion_tokens, total_tokens = (
-            self._extract_response(response)
+            self._extract_response_fast(response) or self._extract_response(response)
         )
 
         return LLMResult(
@@ -236,6 +272,29 @@ class OpenAIProvider(LLMProvider):
             raw_response=response,
         )
 
+    @staticmethod
+    def _extract_response_fast(
+        response: Mapping[str, Any],
+    ) -> tuple[str, int | None, int | None, int | None] | None:
+        """Extract content and usage from a complete, well-formed response.
+
+        Uses direct subscription for the common shape (non-empty string
+        content and all three usage counts present). Returns None for
+        anything else so the caller falls back to :meth:`_extract_response`,
+        which validates and reports errors.
+        """
+        try:
+            content = response["choices"][0]["message"]["content"]
+            usage = response["usage"]
+            prompt_tokens = usage["prompt_tokens"]
+            completion_tokens = usage["completion_tokens"]
+            total_tokens = usage["total_tokens"]
+        except (KeyError, IndexError, TypeError):
+            return None
+        if type(content) is not str or not content.strip() or total_tokens is None:
+            return None
+        return content, prompt_tokens, completion_tokens, total_tokens
+
     @staticmethod
     def _extract_response(
         response: Mapping[str, Any],
@@ -286,6 +345,18 @@ class ClaudeProvider(LLMProvider):
     * ``usage`` (optional dict): ``input_tokens``, ``output_tokens``
     """
 
+    # Error-message fragments meaning the requested model is unknown; these
+    # fail immediately instead of being retried.
+    _MODEL_NOT_RECOGNIZED_PHRASES = (
+        "invalid_request_error",
+        "not_found_error",
+        "not found",
+        "unknown model",
+        "does not exist",
+        "invalid_model",
+        "could not find model",
+    )
+
     def __init__(
         self,
         client: Callable[..., Mapping[str, Any]],
@@ -293,6 +364,8 @@ class ClaudeProvider(LLMProvider):
         default_model: str,
         max_retries: int = 2,
         default_max_tokens: int = 16384,
+        retry_on: tuple[type[BaseException], ...] = _TRANSIENT,
+        retry_backoff: float = 0.5,
         **default_params: Any,
     ) -> None:
         """Create a new Claude provider.
@@ -308,6 +381,12 @@ class ClaudeProvider(LLMProvider):
             default_max_tokens:
                 Default ``max_tokens`` for Anthropic Messages API when not
                 overridden per call.
+            retry_on:
+                Exception types considered transient and retried; others
+                fail the call immediately.
+            retry_backoff:
+                Base delay in seconds before the first retry (exponential,
+                capped, with jitter). ``0`` retries without sleeping.
             **default_params:
                 Extra default kwargs merged into each call (e.g. ``temperature``).
         """
@@ -319,6 +398,9 @@ class ClaudeProvider(LLMProvider):
         self._default_model = default_model
         self._max_retries = max_retries
         self._default_max_tokens = default_max_tokens
+        self._retry_on = retry_on
+        self._retry_backoff = retry_backoff
+        self._rng = random.Random()
         self._default_params = default_params
 
     def generate(
@@ -336,21 +418,8 @@ class ClaudeProvider(LLMProvider):
         params: dict[str, Any] = {**self._default_params, **kwargs}
         max_tokens = int(params.pop("max_tokens", self._default_max_tokens))
 
-        last_error: Exception | None = None
-        attempts = 0
         max_attempts = self._max_retries + 1
-
-        _MODEL_NOT_RECOGNIZED_PHRASES = (
-            "invalid_request_error",
-            "not_found_error",
-            "not found",
-            "unknown model",
-            "does not exist",
-            "invalid_model",
-            "could not find model",
-        )
-
-        while attempts < max_attempts:
+        for attempt in range(1, max_attempts + 1):
             try:
                 response = self._client(
                     prompt=prompt,
@@ -360,21 +429,19 @@ class ClaudeProvider(LLMProvider):
                 )
                 break
             except Exception as exc:  # pragma: no cover - exercised via tests
-                last_error = exc
                 msg_lower = str(exc).lower()
-                if any(phrase in msg_lower for phrase in _MODEL_NOT_RECOGNIZED_PHRASES):
+                if any(
+                    phrase in msg_lower for phrase in self._MODEL_NOT_RECOGNIZED_PHRASES
+                ):
                     raise LLMProviderError(
                         f"Provider API does not identify requested model: {effective_model}. {exc!s}"
                     ) from exc
-                attempts += 1
-                if attempts >= max_attempts:
-                    msg = (
-                        f"Claude call failed after {attempts} attempts: {last_error!s}"
-                    )
-                    raise LLMProviderError(msg) from last_error
-        else:  # pragma: no cover - defensive
-            msg = f"Claude call failed after {attempts} attempts: {last_error!s}"
-            raise LLMProviderError(msg) from last_error
+                if not isinstance(exc, self._retry_on):
+                    raise LLMProviderError(f"Claude call failed: {exc!s}") from exc
+                if attempt == max_attempts:
+                    msg = f"Claude call failed after {attempt} attempts: {exc!s}"
+                    raise LLMProviderError(msg) from exc
+                time.sleep(_retry_delay(attempt, self._retry_backoff, self._rng))
 
         content, prompt_tokens, completion_tokens, total_tokens = (
             self._extract_response(response)
@@ -6,7 +6,6 @@ for each LLM call made during pipeline execution.
 
 import json
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -49,65 +48,44 @@ class TokenUsage:
         }
 
 
-def _calculate_cumulative_tokens(
-    state_path: Path, current_prompt: int, current_completion: int, current_total: int
-) -> tuple[int, int, int]:
-    """Calculate cumulative token totals from state.json and current call.
+def _sum_token_usage(state: dict[str, Any]) -> tuple[int, int, int]:
+    """Sum prompt/completion/total tokens over state["token_usage"].
 
     Args:
-        state_path: Path to state.json file.
-        current_prompt: Prompt tokens from current call.
-        current_completion: Completion tokens from current call.
-        current_total: Total tokens from current call.
+        state: Parsed state.json contents.
 
     Returns:
-        Tuple of (cumulative_prompt, cumulative_completion, cumulative_total).
+        Tuple of (prompt, completion, total) tokens already recorded.
     """
-    cumulative_prompt = current_prompt
-    cumulative_completion = current_completion
-    cumulative_total = current_total
-
-    # Try to read existing token usage from state.json
-    if state_path.exists():
-        try:
-            with state_path.open(encoding="utf-8") as f:
-                state = json.load(f)
-                token_usage = state.get("token_usage", [])
-                if isinstance(token_usage, list):
-                    for entry in token_usage:
-                        if isinstance(entry, dict):
-                            cumulative_prompt += entry.get("prompt_tokens", 0)
-                            cumulative_completion += entry.get("completion_tokens", 0)
-                            cumulative_total += entry.get("total_tokens", 0)
-        except (OSError, json.JSONDecodeError, KeyError):
-            # If we can't read state.json, just use current call's tokens
-            pass
-
-    return cumulative_prompt, cumulative_completion, cumulative_total
-
-
-def _append_cumulative_log(
-    log_path: Path,
-    cumulative_prompt: int,
-    cumulative_completion: int,
-    cumulative_total: int,
-) -> None:
-    """Append cumulative token totals to the log file.
+    prompt = completion = total = 0
+    token_usage = state.get("token_usage", [])
+    if isinstance(token_usage, list):
+        for entry in token_usage:
+            if isinstance(entry, dict):
+                prompt += entry.get("prompt_tokens", 0)
+                completion += entry.get("completion_tokens", 0)
+                total += entry.get("total_tokens", 0)
+    return prompt, completion, total
+
+
+def _read_recorded_usage(state_path: Path) -> tuple[int, int, int]:
+    """Sum token usage recorded in state.json; zeros if it cannot be read.
 
     Args:
-        log_path: Path to run.log file.
-        cumulative_prompt: Cumulative prompt tokens.
-        cumulative_completion: Cumulative completion tokens.
-        cumulative_total: Cumulative total tokens.
+        state_path: Path to state.json file.
+
+    Returns:
+        Tuple of (prompt, completion, total) tokens already recorded.
     """
-    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
-    message = (
-        f"Cumulative token usage: prompt_tokens={cumulative_prompt}, "
-        f"completion_tokens={cumulative_completion}, total_tokens={cumulative_total}"
-    )
-    entry = f"[{timestamp}] [INFO] {message}\n"
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write(entry)
+    try:
+        with state_path.open("rb") as f:
+            state = json.loads(f.read())
+    except (OSError, ValueError):
+        # If we can't read state.json, just use current call's tokens
+        return 0, 0, 0
+    if not isinstance(state, dict):
+        return 0, 0, 0
+    return _sum_token_usage(state)
 
 
 def record_token_usage(
@@ -118,6 +96,7 @@ def record_token_usage(
     prompt_tokens: int,
     completion_tokens: int,
     total_tokens: int | None = None,
+    state: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Record token usage for an LLM call.
 
@@ -134,6 +113,9 @@ def record_token_usage(
         completion_tokens: Number of completion tokens used.
         total_tokens: Total tokens used. If None, calculated as
             prompt_tokens + completion_tokens.
+        state: The run's current state, if the caller has it loaded. Used
+            for the cumulative totals instead of re-reading state.json; it
+            must not yet include this call's entry.
 
     Returns:
         Dictionary representation of token usage for state.json.
@@ -141,27 +123,18 @@ def record_token_usage(
     if total_tokens is None:
         total_tokens = prompt_tokens + completion_tokens
 
-    # Log single line with token counts (simplified format: just the three values)
-    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
-    message = (
-        f"Token usage: prompt_tokens={prompt_tokens}, "
-        f"completion_tokens={completion_tokens}, total_tokens={total_tokens}"
+    # Running totals: from the caller's state if given, else from state.json
+    if state is not None:
+        recorded = _sum_token_usage(state)
+    else:
+        recorded = _read_recorded_usage(logger.log_path.parent / "state.json")
+    cumulative = (
+        recorded[0] + prompt_tokens,
+        recorded[1] + completion_tokens,
+        recorded[2] + total_tokens,
     )
-    entry = f"[{timestamp}] [INFO] {message}\n"
-    with logger.log_path.open("a", encoding="utf-8") as f:
-        f.write(entry)
-
-    # Calculate cumulative totals from state.json
-    state_path = logger.log_path.parent / "state.json"
-    cumulative_prompt, cumulative_completion, cumulative_total = (
-        _calculate_cumulative_tokens(
-            state_path, prompt_tokens, completion_tokens, total_tokens
-        )
-    )
-
-    # Append cumulative line immediately after
-    _append_cumulative_log(
-        logger.log_path, cumulative_prompt, cumulative_completion, cumulative_total
+    logger.log_token_usage_with_cumulative(
+        prompt_tokens, completion_tokens, total_tokens, cumulative
     )
 
     # Return dict for state.json
@@ -3,16 +3,22 @@
 Provides a simple logger that writes timestamped entries to run.log.
 """
 
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 
 class RunLogger:
     """Logger that writes to a run's log file.
 
-    All log entries are timestamped in ISO 8601 format (UTC).
+    All log entries are timestamped in ISO 8601 format (UTC). The log file is
+    opened in append mode for each write and closed again, so the logger
+    holds no file handle and entries stay ordered with other appenders to
+    the same run.log.
     """
 
+    # (epoch second, formatted timestamp) of the last _timestamp() call.
+    _ts_cache: tuple[int, str] = (-1, "")
+
     def __init__(self, log_path: Path) -> None:
         """Initialize the logger.
 
@@ -27,8 +33,22 @@ class RunLogger:
         return self._log_path
 
     def _timestamp(self) -> str:
-        """Return current UTC timestamp in ISO 8601 format."""
-        return datetime.now(timezone.utc).isoformat(timespec="seconds")
+        """Return current UTC timestamp in ISO 8601 format.
+
+        Formatted directly from ``time.gmtime`` (same output as
+        ``datetime.isoformat(timespec="seconds")`` in UTC) and reused for all
+        entries written within the same second.
+        """
+        now = int(time.time())
+        if now == self._ts_cache[0]:
+            return self._ts_cache[1]
+        tm = time.gmtime(now)
+        stamp = (
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}+00:00"
+        )
+        self._ts_cache = (now, stamp)
+        return stamp
 
     def _write(self, level: str, message: str) -> None:
         """Write a log entry to the log file.
@@ -37,10 +57,19 @@ class RunLogger:
             level: Log level (INFO, ERROR, etc.).
             message: The message to log.
         """
-        timestamp = self._timestamp()
-        entry = f"[{timestamp}] [{level}] {message}\n"
+        self._write_block(level, (message,))
+
+    def _write_block(self, level: str, messages: tuple[str, ...]) -> None:
+        """Write several entries with one timestamp and a single write.
+
+        Args:
+            level: Log level applied to every entry.
+            messages: Messages to log, in order.
+        """
+        prefix = f"[{self._timestamp()}] [{level}] "
+        block = "".join(f"{prefix}{message}\n" for message in messages)
         with self._log_path.open("a", encoding="utf-8") as f:
-            f.write(entry)
+            f.write(block)
 
     def info(self, message: str) -> None:
         """Log an INFO level message.
@@ -85,10 +114,15 @@ class RunLogger:
             context_dir: Path to the app's context directory.
             prompts_dir: Path to the app's prompts directory.
         """
-        self.info(f"Run initialized for app: {app_name}")
-        self.info(f"Seed: {seed}")
-        self.info(f"Context directory: {context_dir}")
-        self.info(f"Prompts directory: {prompts_dir}")
+        self._write_block(
+            "INFO",
+            (
+                f"Run initialized for app: {app_name}",
+                f"Seed: {seed}",
+                f"Context directory: {context_dir}",
+                f"Prompts directory: {prompts_dir}",
+            ),
+        )
 
     def log_stage_start(self, stage_name: str) -> None:
         """Log the start of a pipeline stage.
@@ -151,6 +185,35 @@ class RunLogger:
             f"total_tokens={total_tokens}"
         )
 
+    def log_token_usage_with_cumulative(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        total_tokens: int,
+        cumulative: tuple[int, int, int],
+    ) -> None:
+        """Log one LLM call's token counts followed by the run's running totals.
+
+        Both lines share a timestamp and are written together.
+
+        Args:
+            prompt_tokens: Prompt tokens for this call.
+            completion_tokens: Completion tokens for this call.
+            total_tokens: Total tokens for this call.
+            cumulative: (prompt, completion, total) tokens for the run so far,
+                including this call.
+        """
+        cum_prompt, cum_completion, cum_total = cumulative
+        self._write_block(
+            "INFO",
+            (
+                f"Token usage: prompt_tokens={prompt_tokens}, "
+                f"completion_tokens={completion_tokens}, total_tokens={total_tokens}",
+                f"Cumulative token usage: prompt_tokens={cum_prompt}, "
+                f"completion_tokens={cum_completion}, total_tokens={cum_total}",
+            ),
+        )
+
     def log_tts_character_usage(
         self,
         step: str,
@@ -1,19 +1,47 @@
-"""Pipeline configuration, runner, resolve, state, context, and providers."""
-
-from llm_storytell.pipeline.loader import (
-    LLMConfig,
-    LoopConfig,
-    OutputConfig,
-    PipelineConfig,
-    PipelineConfigError,
-    PipelineStep,
-    StepInput,
-    StepValidate,
-    load_pipeline_config,
-)
-from llm_storytell.pipeline.resolve import RunSettings, resolve_run_settings
-from llm_storytell.pipeline.runner import run_pipeline
-from llm_storytell.pipeline.state import update_state_selected_context
+"""Pipeline configuration, runner, resolve, state, context, and providers.
+
+Public names are resolved lazily (PEP 562): importing a light submodule such
+as ``llm_storytell.pipeline.state`` does not pull in the runner and every
+step it depends on.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from llm_storytell.pipeline.loader import (
+        LLMConfig,
+        LoopConfig,
+        OutputConfig,
+        PipelineConfig,
+        PipelineConfigError,
+        PipelineStep,
+        StepInput,
+        StepValidate,
+        load_pipeline_config,
+    )
+    from llm_storytell.pipeline.resolve import RunSettings, resolve_run_settings
+    from llm_storytell.pipeline.runner import run_pipeline
+    from llm_storytell.pipeline.state import update_state_selected_context
+
+# Public name -> submodule defining it.
+_LAZY_ATTRS = {
+    "LLMConfig": "loader",
+    "LoopConfig": "loader",
+    "OutputConfig": "loader",
+    "PipelineConfig": "loader",
+    "PipelineConfigError": "loader",
+    "PipelineStep": "loader",
+    "StepInput": "loader",
+    "StepValidate": "loader",
+    "load_pipeline_config": "loader",
+    "RunSettings": "resolve",
+    "resolve_run_settings": "resolve",
+    "run_pipeline": "runner",
+    "update_state_selected_context": "state",
+}
 
 __all__ = [
     "LLMConfig",
@@ -30,3 +58,16 @@ __all__ = [
     "run_pipeline",
     "update_state_selected_context",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
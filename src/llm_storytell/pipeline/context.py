@@ -1,5 +1,6 @@
 """Pipeline context loading and persisting selected_context to state."""
 
+import os
 from pathlib import Path
 from typing import Any
 
@@ -47,11 +48,11 @@ def load_and_persist_context(
     selection = loader.load_context(run_id, model=model)
 
     selected_context: dict[str, Any] = {
-        "location": Path(selection.selected_location).name
+        "location": os.path.basename(selection.selected_location)
         if selection.selected_location
         else None,
-        "characters": [Path(p).name for p in selection.selected_characters],
-        "world_files": [Path(p).name for p in selection.world_files],
+        "characters": [os.path.basename(p) for p in selection.selected_characters],
+        "world_files": [os.path.basename(p) for p in selection.world_files],
     }
     update_state_selected_context(run_dir, selected_context)
     return selection
@@ -24,48 +24,41 @@ class ProviderError(Exception):
     pass
 
 
-def _load_creds_api_key(config_path: Path) -> str | None:
-    """Load OpenAI API key from config_path/creds.json. Returns None if missing/invalid."""
-    creds_path = config_path / "creds.json"
-    if not creds_path.exists():
-        return None
+# creds.json field names per service, in lookup order
+_OPENAI_KEY_NAMES = ("openai_api_key", "OPENAI_KEY", "OPEN_AI", "OPENAI_API_KEY")
+_ANTHROPIC_KEY_NAMES = ("ANTHROPIC_API_KEY", "anthropic_api_key")
+_ELEVENLABS_KEY_NAMES = ("ELEVENLABS_API_KEY", "elevenlabs_api_key")
+
+
+def _load_creds_key(config_path: Path, names: tuple[str, ...]) -> str | None:
+    """Return the first non-empty value among names in config_path/creds.json.
+
+    Returns None if the file is missing, unreadable, not a JSON object, or
+    has none of the fields.
+    """
     try:
-        with creds_path.open(encoding="utf-8") as f:
-            creds = json.load(f)
-        return (
-            creds.get("openai_api_key")
-            or creds.get("OPENAI_KEY")
-            or creds.get("OPEN_AI")
-            or creds.get("OPENAI_API_KEY")
-        )
-    except (OSError, json.JSONDecodeError, KeyError):
+        with open(config_path / "creds.json", "rb") as f:
+            creds = json.loads(f.read())
+    except (OSError, ValueError):
         return None
+    if not isinstance(creds, dict):
+        return None
+    return next((value for name in names if (value := creds.get(name))), None)
+
+
+def _load_creds_api_key(config_path: Path) -> str | None:
+    """Load OpenAI API key from config_path/creds.json. Returns None if missing/invalid."""
+    return _load_creds_key(config_path, _OPENAI_KEY_NAMES)
 
 
 def _load_anthropic_api_key(config_path: Path) -> str | None:
     """Load Anthropic API key from config_path/creds.json. Returns None if missing/invalid."""
-    creds_path = config_path / "creds.json"
-    if not creds_path.exists():
-        return None
-    try:
-        with creds_path.open(encoding="utf-8") as f:
-            creds = json.load(f)
-        return creds.get("ANTHROPIC_API_KEY") or creds.get("anthropic_api_key")
-    except (OSError, json.JSONDecodeError, KeyError):
-        return None
+    return _load_creds_key(config_path, _ANTHROPIC_KEY_NAMES)
 
 
 def _load_elevenlabs_api_key(config_path: Path) -> str | None:
     """Load ElevenLabs API key from config_path/creds.json. Returns None if missing/invalid."""
-    creds_path = config_path / "creds.json"
-    if not creds_path.exists():
-        return None
-    try:
-        with creds_path.open(encoding="utf-8") as f:
-            creds = json.load(f)
-        return creds.get("ELEVENLABS_API_KEY") or creds.get("elevenlabs_api_key")
-    except (OSError, json.JSONDecodeError, KeyError):
-        return None
+    return _load_creds_key(config_path, _ELEVENLABS_KEY_NAMES)
 
 
 def create_llm_provider(
@@ -92,6 +85,7 @@ def create_llm_provider(
 
     if provider_id == "claude":
         try:
+            import anthropic
             from anthropic import Anthropic
         except ImportError as e:
             raise ProviderError(
@@ -134,6 +128,13 @@ def create_llm_provider(
             return ClaudeProvider(
                 client=claude_client_wrapper,
                 default_model=default_model,
+                retry_on=(
+                    anthropic.APIConnectionError,
+                    anthropic.RateLimitError,
+                    anthropic.InternalServerError,
+                    TimeoutError,
+                    ConnectionError,
+                ),
                 temperature=0.7,
             )
         except Exception as e:
@@ -145,6 +146,7 @@ def create_llm_provider(
         )
 
     try:
+        import openai
         from openai import OpenAI
     except ImportError as e:
         raise ProviderError(
@@ -184,6 +186,13 @@ def create_llm_provider(
         return OpenAIProvider(
             client=openai_client_wrapper,
             default_model=default_model,
+            retry_on=(
+                openai.APIConnectionError,
+                openai.RateLimitError,
+                openai.InternalServerError,
+                TimeoutError,
+                ConnectionError,
+            ),
             temperature=0.7,
         )
     except Exception as e:
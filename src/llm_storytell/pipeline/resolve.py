@@ -1,5 +1,6 @@
 """Pipeline run settings resolution: CLI-like args + app config -> RunSettings."""
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -31,21 +32,23 @@ def _looks_like_openai_chat_model(model: str) -> bool:
     return False
 
 
+# "N" or "LO-HI" section length hints, surrounding whitespace allowed.
+_SECTION_LENGTH_RE = re.compile(r"\s*(\d+)(?:\s*-\s*(\d+))?\s*")
+
+
 def _section_length_midpoint(section_length_str: str) -> int:
-    """Parse section_length string (e.g. '400-600') to midpoint; fallback 500."""
-    s = section_length_str.strip()
-    if "-" in s:
-        parts = s.split("-", 1)
-        try:
-            lo, hi = int(parts[0].strip()), int(parts[1].strip())
-            if lo > 0 and hi >= lo:
-                return (lo + hi) // 2
-        except ValueError:
-            pass
-    try:
-        return int(s)
-    except ValueError:
-        pass
+    """Parse section_length string (e.g. '400-600') to midpoint; fallback 500.
+
+    A single number is its own midpoint. Anything else, including zero,
+    a descending range, or a negative number, falls back to 500.
+    """
+    m = _SECTION_LENGTH_RE.fullmatch(section_length_str)
+    if m is None:
+        return 500
+    lo = int(m[1])
+    hi = lo if m[2] is None else int(m[2])
+    if lo > 0 and hi >= lo:
+        return (lo + hi) // 2
     return 500
 
 
@@ -6,12 +6,14 @@ import time
 import traceback
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable
 
 import httpx
 
 from llm_storytell.context import ContextLoaderError
 from llm_storytell.llm import LLMProvider, LLMProviderError
 from llm_storytell.llm.pricing import estimate_run_cost, estimate_tts_cost
+from llm_storytell.logging import RunLogger
 from llm_storytell.pipeline.context import load_and_persist_context
 from llm_storytell.pipeline.deliverable_to_book import (
     copy_no_tts_deliverable_to_book,
@@ -71,6 +73,41 @@ def _log_and_print_failure(
     )
 
 
+def _run_stage(
+    logger: RunLogger,
+    run_dir: Path,
+    stage_name: str,
+    failure_message: str,
+    errors: tuple[type[BaseException], ...],
+    step: Callable[..., Any],
+    /,
+    **kwargs: Any,
+) -> bool:
+    """Run one pipeline stage between stage start/end log entries.
+
+    Args:
+        logger: Run logger.
+        run_dir: Run directory (for the failure message).
+        stage_name: Stage name for run.log (e.g. "section_02").
+        failure_message: Prefix for the error report if the stage fails.
+        errors: Exception types that mean the stage failed.
+        step: Step function, called with ``kwargs`` (which may repeat
+            logger and run_dir; the leading arguments are positional-only).
+
+    Returns:
+        True on success; False after logging and printing the failure.
+    """
+    logger.log_stage_start(stage_name)
+    try:
+        step(**kwargs)
+    except errors as e:
+        logger.log_stage_end(stage_name, success=False)
+        _log_and_print_failure(logger, run_dir, failure_message, e)
+        return False
+    logger.log_stage_end(stage_name, success=True)
+    return True
+
+
 def _load_telegram_creds(config_path: Path) -> tuple[str, str]:
     creds_file = (Path(config_path) / "creds.json").expanduser().resolve()
     if not creds_file.is_file():
@@ -279,20 +316,20 @@ def run_pipeline(settings: RunSettings) -> int:
             f"[llm_storytell] Generating outline ({settings.beats} beats)...",
             flush=True,
         )
-        logger.log_stage_start("outline")
-        try:
-            execute_outline_step(
-                run_dir=run_dir,
-                context_dir=app_paths.context_dir,
-                prompts_dir=app_paths.prompts_dir,
-                llm_provider=llm,
-                logger=logger,
-                schema_base=schema_base,
-            )
-            logger.log_stage_end("outline", success=True)
-        except (OutlineStepError, LLMProviderError) as e:
-            logger.log_stage_end("outline", success=False)
-            _log_and_print_failure(logger, run_dir, "outline stage failed", e)
+        if not _run_stage(
+            logger,
+            run_dir,
+            "outline",
+            "outline stage failed",
+            (OutlineStepError, LLMProviderError),
+            execute_outline_step,
+            run_dir=run_dir,
+            context_dir=app_paths.context_dir,
+            prompts_dir=app_paths.prompts_dir,
+            llm_provider=llm,
+            logger=logger,
+            schema_base=schema_base,
+        ):
             return 1
 
         try:
@@ -316,7 +353,9 @@ def run_pipeline(settings: RunSettings) -> int:
 
         num_sections = len(outline_beats)
 
-        # Stage 2: Section loop
+        # Stage 2: Section loop. Strictly sequential: section N's prompt uses
+        # the rolling summary and continuity ledger written by summarize N-1,
+        # so sections cannot be generated concurrently.
         print(
             f"[llm_storytell] Generating {num_sections} section(s)...",
             flush=True,
@@ -328,67 +367,56 @@ def run_pipeline(settings: RunSettings) -> int:
                 f"[llm_storytell]  - Section {section_index + 1}/{num_sections}",
                 flush=True,
             )
-            logger.log_stage_start(stage_name)
-            try:
-                execute_section_step(
-                    run_dir=run_dir,
-                    context_dir=app_paths.context_dir,
-                    prompts_dir=app_paths.prompts_dir,
-                    llm_provider=llm,
-                    logger=logger,
-                    section_index=section_index,
-                    section_length=section_length,
-                    schema_base=schema_base,
-                )
-                logger.log_stage_end(stage_name, success=True)
-            except (SectionStepError, LLMProviderError) as e:
-                logger.log_stage_end(stage_name, success=False)
-                _log_and_print_failure(
-                    logger,
-                    run_dir,
-                    f"section {section_index} failed",
-                    e,
-                )
-                return 1
-
-            summarize_stage_name = f"summarize_{section_index:02d}"
-            logger.log_stage_start(summarize_stage_name)
-            try:
-                execute_summarize_step(
-                    run_dir=run_dir,
-                    prompts_dir=app_paths.prompts_dir,
-                    llm_provider=llm,
-                    logger=logger,
-                    section_index=section_index,
-                    schema_base=schema_base,
-                )
-                logger.log_stage_end(summarize_stage_name, success=True)
-            except (SummarizeStepError, LLMProviderError) as e:
-                logger.log_stage_end(summarize_stage_name, success=False)
-                _log_and_print_failure(
-                    logger,
-                    run_dir,
-                    f"summarize {section_index} failed",
-                    e,
-                )
+            if not _run_stage(
+                logger,
+                run_dir,
+                stage_name,
+                f"section {section_index} failed",
+                (SectionStepError, LLMProviderError),
+                execute_section_step,
+                run_dir=run_dir,
+                context_dir=app_paths.context_dir,
+                prompts_dir=app_paths.prompts_dir,
+                llm_provider=llm,
+                logger=logger,
+                section_index=section_index,
+                section_length=section_length,
+                schema_base=schema_base,
+            ):
                 return 1
 
-        # Stage 3: Critic
-        print("[llm_storytell] Running critic/finalization...", flush=True)
-        logger.log_stage_start("critic")
-        try:
-            execute_critic_step(
+            if not _run_stage(
+                logger,
+                run_dir,
+                f"summarize_{section_index:02d}",
+                f"summarize {section_index} failed",
+                (SummarizeStepError, LLMProviderError),
+                execute_summarize_step,
                 run_dir=run_dir,
-                context_dir=app_paths.context_dir,
                 prompts_dir=app_paths.prompts_dir,
                 llm_provider=llm,
                 logger=logger,
+                section_index=section_index,
                 schema_base=schema_base,
-            )
-            logger.log_stage_end("critic", success=True)
-        except (CriticStepError, LLMProviderError) as e:
-            logger.log_stage_end("critic", success=False)
-            _log_and_print_failure(logger, run_dir, "critic stage failed", e)
+            ):
+                return 1
+
+        # Stage 3: Critic
+        print("[llm_storytell] Running critic/finalization...", flush=True)
+        if not _run_stage(
+            logger,
+            run_dir,
+            "critic",
+            "critic stage failed",
+            (CriticStepError, LLMProviderError),
+            execute_critic_step,
+            run_dir=run_dir,
+            context_dir=app_paths.context_dir,
+            prompts_dir=app_paths.prompts_dir,
+            llm_provider=llm,
+            logger=logger,
+            schema_base=schema_base,
+        ):
             return 1
 
         if not settings.tts_enabled:
@@ -412,38 +440,38 @@ def run_pipeline(settings: RunSettings) -> int:
             tts_voice = settings.resolved_tts_config.get("tts_voice")
 
             print("[llm_storytell] Running TTS (text-to-speech)...", flush=True)
-            logger.log_stage_start("tts")
-            try:
-                execute_llm_tts_step(
-                    run_dir=run_dir,
-                    tts_provider=tts_provider,
-                    logger=logger,
-                    tts_model=tts_model,
-                    tts_voice=tts_voice,
-                )
-                logger.log_stage_end("tts", success=True)
-            except (LLMTTSStepError, TTSProviderError) as e:
-                logger.log_stage_end("tts", success=False)
-                _log_and_print_failure(logger, run_dir, "TTS stage failed", e)
+            if not _run_stage(
+                logger,
+                run_dir,
+                "tts",
+                "TTS stage failed",
+                (LLMTTSStepError, TTSProviderError),
+                execute_llm_tts_step,
+                run_dir=run_dir,
+                tts_provider=tts_provider,
+                logger=logger,
+                tts_model=tts_model,
+                tts_voice=tts_voice,
+            ):
                 return 1
 
             print("[llm_storytell] Running audio prep (stitch + mix)...", flush=True)
-            logger.log_stage_start("audio_prep")
-            try:
-                execute_audio_prep_step(
-                    run_dir=run_dir,
-                    base_dir=base_dir,
-                    logger=logger,
-                    app_name=app_paths.app_name,
-                )
-                logger.log_stage_end("audio_prep", success=True)
-                copy_tts_deliverable_to_book(
-                    run_dir=run_dir, base_dir=base_dir, logger=logger
-                )
-            except AudioPrepStepError as e:
-                logger.log_stage_end("audio_prep", success=False)
-                _log_and_print_failure(logger, run_dir, "audio-prep stage failed", e)
+            if not _run_stage(
+                logger,
+                run_dir,
+                "audio_prep",
+                "audio-prep stage failed",
+                (AudioPrepStepError,),
+                execute_audio_prep_step,
+                run_dir=run_dir,
+                base_dir=base_dir,
+                logger=logger,
+                app_name=app_paths.app_name,
+            ):
                 return 1
+            copy_tts_deliverable_to_book(
+                run_dir=run_dir, base_dir=base_dir, logger=logger
+            )
 
         try:
             state = load_state(run_dir)
@@ -507,17 +535,17 @@ def run_pipeline(settings: RunSettings) -> int:
 
         if settings.delivery:
             print("[llm_storytell] Delivering to Telegram...", flush=True)
-            logger.log_stage_start("telegram_delivery")
-            try:
-                _execute_telegram_delivery(
-                    config_path=settings.config_path,
-                    base_dir=base_dir,
-                    logger=logger,
-                )
-                logger.log_stage_end("telegram_delivery", success=True)
-            except TelegramDeliveryError as e:
-                logger.log_stage_end("telegram_delivery", success=False)
-                _log_and_print_failure(logger, run_dir, "telegram delivery failed", e)
+            if not _run_stage(
+                logger,
+                run_dir,
+                "telegram_delivery",
+                "telegram delivery failed",
+                (TelegramDeliveryError,),
+                _execute_telegram_delivery,
+                config_path=settings.config_path,
+                base_dir=base_dir,
+                logger=logger,
+            ):
                 return 1
 
         end_ts = _timestamp_utc()
@@ -1,6 +1,7 @@
 """Pipeline state IO: atomic read/update of state.json in run directories."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 from typing import Any, Callable
@@ -12,6 +13,20 @@ class StateIOError(Exception):
     pass
 
 
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file with one binary read.
+
+    json.loads decodes the bytes itself (UTF-8, or UTF-16/32 when detected),
+    which skips the buffered text-mode wrapper of json.load.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON.
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
 def load_state(run_dir: Path) -> dict[str, Any]:
     """Load state.json from run directory.
 
@@ -25,11 +40,10 @@ def load_state(run_dir: Path) -> dict[str, Any]:
         StateIOError: If state.json is missing, invalid JSON, or unreadable.
     """
     state_path = run_dir / "state.json"
-    if not state_path.exists():
-        raise StateIOError(f"State file not found: {state_path}")
     try:
-        with state_path.open(encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json(state_path)
+    except FileNotFoundError:
+        raise StateIOError(f"State file not found: {state_path}") from None
     except json.JSONDecodeError as e:
         raise StateIOError(f"Invalid JSON in state.json: {e}") from e
     except OSError as e:
@@ -49,11 +63,10 @@ def load_inputs(run_dir: Path) -> dict[str, Any]:
         StateIOError: If inputs.json is missing, invalid JSON, or unreadable.
     """
     inputs_path = run_dir / "inputs.json"
-    if not inputs_path.exists():
-        raise StateIOError(f"inputs.json not found: {inputs_path}")
     try:
-        with inputs_path.open(encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json(inputs_path)
+    except FileNotFoundError:
+        raise StateIOError(f"inputs.json not found: {inputs_path}") from None
     except json.JSONDecodeError as e:
         raise StateIOError(f"Invalid JSON in inputs.json: {e}") from e
     except OSError as e:
@@ -61,47 +74,109 @@ def load_inputs(run_dir: Path) -> dict[str, Any]:
 
 
 def update_state_atomic(
-    run_dir: Path, updater: Callable[[dict[str, Any]], None]
+    run_dir: Path,
+    updater: Callable[[dict[str, Any]], None],
+    state: dict[str, Any] | None = None,
 ) -> None:
     """Update state.json by applying updater to current state, then atomic write.
 
-    Uses temp file + rename so partial state.json is never left on failure.
+    Uses temp file + rename so partial state.json is never left on failure;
+    the file and directory are fsynced so a completed update survives a crash.
 
     Args:
         run_dir: Path to the run directory.
         updater: Callable that mutates the state dict in place (no return).
+        state: State dict previously returned by load_state for this run. If
+            given, it is updated in place and written back without re-reading
+            state.json; only pass it when nothing else has written state.json
+            since it was loaded.
 
     Raises:
         StateIOError: On read failure, write failure, or rename failure.
     """
     state_path = run_dir / "state.json"
-    try:
-        with state_path.open(encoding="utf-8") as f:
-            state = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        raise StateIOError(f"Error reading state for update: {e}") from e
+    if state is None:
+        try:
+            state = _read_json(state_path)
+        except (json.JSONDecodeError, OSError) as e:
+            raise StateIOError(f"Error reading state for update: {e}") from e
 
     updater(state)
 
-    temp_file = None
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=run_dir,
-            delete=False,
-            suffix=".tmp",
-        ) as f:
-            temp_file = Path(f.name)
-            json.dump(state, f, indent=2, ensure_ascii=False)
-        temp_file.replace(state_path)
-        temp_file = None
+        write_atomic(
+            state_path, json.dumps(state, indent=2, ensure_ascii=False), fsync=True
+        )
     except OSError as e:
-        if temp_file is not None and temp_file.exists():
-            temp_file.unlink(missing_ok=True)
         raise StateIOError(f"Error writing updated state: {e}") from e
 
 
+def write_atomic(path: Path, data: str | bytes, *, fsync: bool = False) -> int:
+    """Write data to path atomically via a temp file and os.replace.
+
+    The temp file is created next to ``path`` (same filesystem) with a
+    ``.tmp`` suffix and removed if anything fails, so ``path`` is either left
+    untouched or fully replaced. Text is encoded as UTF-8 and written as-is
+    (no newline translation).
+
+    Args:
+        path: Destination file; its parent directory must exist.
+        data: Content to write; str is encoded as UTF-8.
+        fsync: If True, fsync the temp file before the rename and the parent
+            directory after it, so the new content survives a crash once
+            this returns.
+
+    Returns:
+        Number of bytes written (the size of ``path`` after the rename).
+
+    Raises:
+        OSError: If the temp file cannot be created, written, or renamed.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    if fsync:
+        _fsync_dir(path.parent)
+    return len(data)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory entry update (the rename) to disk.
+
+    Best effort: skipped where directories cannot be opened (Windows) and
+    ignored on filesystems that reject fsync on directories, since the
+    rename itself has already succeeded.
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def update_state_selected_context(
     run_dir: Path, selected_context: dict[str, Any]
 ) -> None:
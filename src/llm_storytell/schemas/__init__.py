@@ -2,8 +2,11 @@
 
 import json
 from pathlib import Path
+from typing import Any
 
 import jsonschema
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from llm_storytell.logging import RunLogger
 
@@ -14,28 +17,52 @@ class SchemaValidationError(Exception):
     pass
 
 
-def validate_json_schema(
-    data: dict | list,
-    schema_path: Path,
-    logger: RunLogger | None = None,
-) -> None:
-    """Validate JSON data against a JSON schema.
+def _find_project_root(start: Path) -> Path:
+    """Find the project root by looking for SPEC.md or pyproject.toml.
+
+    Walks from ``start`` up through its parents.
+
+    Args:
+        start: Directory to start from (normally the current working directory).
+
+    Returns:
+        The first directory containing a marker file, or the repository root
+        derived from this package's location if none is found.
+    """
+    for parent in [start, *start.parents]:
+        if (parent / "SPEC.md").exists() or (parent / "pyproject.toml").exists():
+            return parent
+    # Fallback: this package is src/llm_storytell/schemas under the root
+    return Path(__file__).parent.parent.parent.parent
+
+
+def default_schema_base() -> Path:
+    """Return src/llm_storytell/schemas under the project root of the cwd.
+
+    Used by pipeline steps when no explicit ``schema_base`` is given.
+    """
+    return _find_project_root(Path.cwd()) / "src" / "llm_storytell" / "schemas"
+
+
+def _load_validator(schema_path: Path, logger: RunLogger | None) -> Any:
+    """Load a schema file and build a checked validator for it.
 
     Args:
-        data: The JSON data to validate (dict or list).
         schema_path: Path to the JSON schema file.
-        logger: Optional logger for validation errors.
+        logger: Optional logger for load errors.
+
+    Returns:
+        A jsonschema validator instance for the schema's declared draft.
 
     Raises:
-        SchemaValidationError: If validation fails or schema cannot be loaded.
+        SchemaValidationError: If the schema cannot be read or is invalid.
         FileNotFoundError: If schema file does not exist.
     """
-    if not schema_path.exists():
-        raise FileNotFoundError(f"Schema file not found: {schema_path}")
-
     try:
         with schema_path.open(encoding="utf-8") as f:
             schema = json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Schema file not found: {schema_path}") from None
     except json.JSONDecodeError as e:
         msg = f"Invalid JSON in schema file {schema_path}: {e}"
         if logger:
@@ -47,17 +74,57 @@ def validate_json_schema(
             logger.error(msg)
         raise SchemaValidationError(msg) from e
 
+    cls = validator_for(schema)
     try:
-        jsonschema.validate(instance=data, schema=schema)
-    except jsonschema.ValidationError as e:
-        error_msg = f"Schema validation failed: {e.message}"
-        if e.path:
-            error_msg += f" (at path: {'/'.join(str(p) for p in e.path)})"
-        if logger:
-            logger.log_validation_failure(step="schema_validation", error=error_msg)
-        raise SchemaValidationError(error_msg) from e
+        cls.check_schema(schema)
     except jsonschema.SchemaError as e:
         msg = f"Invalid schema in {schema_path}: {e}"
         if logger:
             logger.error(msg)
         raise SchemaValidationError(msg) from e
+    return cls(schema)
+
+
+def load_schema(schema_path: Path) -> dict[str, Any]:
+    """Return the parsed JSON schema at schema_path.
+
+    Args:
+        schema_path: Path to the JSON schema file.
+
+    Returns:
+        The schema document.
+
+    Raises:
+        SchemaValidationError: If the schema cannot be read or is invalid.
+        FileNotFoundError: If schema file does not exist.
+    """
+    return _load_validator(schema_path, None).schema
+
+
+def validate_json_schema(
+    data: dict | list,
+    schema_path: Path,
+    logger: RunLogger | None = None,
+) -> None:
+    """Validate JSON data against a JSON schema.
+
+    Args:
+        data: The JSON data to validate (dict or list).
+        schema_path: Path to the JSON schema file.
+        logger: Optional logger for validation errors.
+
+    Raises:
+        SchemaValidationError: If validation fails or schema cannot be loaded.
+        FileNotFoundError: If schema file does not exist.
+    """
+    validator = _load_validator(schema_path, logger)
+
+    # Same error selection as jsonschema.validate()
+    error = best_match(validator.iter_errors(data))
+    if error is not None:
+        error_msg = f"Schema validation failed: {error.message}"
+        if error.path:
+            error_msg += f" (at path: {'/'.join(str(p) for p in error.path)})"
+        if logger:
+            logger.log_validation_failure(step="schema_validation", error=error_msg)
+        raise SchemaValidationError(error_msg) from error
@@ -11,14 +11,21 @@ Critic expects LLM output in strict two-block format:
 """
 
 import json
+import os
 import re
-import tempfile
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    # libyaml-backed loader; same safe semantics, parsed in C
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from llm_storytell.context import ContextLoaderError, build_prompt_context_vars
 from llm_storytell.llm import LLMProvider, LLMProviderError
 from llm_storytell.llm.token_tracking import record_token_usage
@@ -28,7 +35,11 @@ from llm_storytell.prompt_render import (
     TemplateNotFoundError,
     render_prompt,
 )
-from llm_storytell.schemas import SchemaValidationError, validate_json_schema
+from llm_storytell.schemas import (
+    SchemaValidationError,
+    default_schema_base,
+    validate_json_schema,
+)
 from llm_storytell.steps.llm_io import save_llm_io
 
 
@@ -38,6 +49,46 @@ class CriticStepError(Exception):
     pass
 
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+# Keys the editor report object must contain
+_EDITOR_REPORT_REQUIRED_KEYS = frozenset({"changes_applied", "issues_found"})
+
+
+def _split_frontmatter_fast(content: str) -> tuple[str, str] | None:
+    """Split frontmatter from body with plain string scanning.
+
+    Equivalent to matching ``^---\\s*\\n(.*?)\\n---\\s*\\n(.*)$`` (DOTALL)
+    for the common layout where the opening fence is exactly ``---\\n``
+    followed by non-whitespace; avoids running the regex over the whole body.
+
+    Args:
+        content: Markdown content with frontmatter.
+
+    Returns:
+        ``(frontmatter_text, markdown_body)``, or None if no closing fence is
+        found.
+    """
+    n = len(content)
+    end = content.find("\n---", 4)
+    while end != -1:
+        j = end + 4
+        # Common case: "\n---\n" directly followed by the body
+        if content.startswith("\n", j) and not content[j + 1 : j + 2].isspace():
+            return content[4:end], content[j + 1 :]
+        # Otherwise the closing fence must be followed by whitespace containing
+        # a newline; the body starts after the last newline in that run.
+        last_nl = -1
+        while j < n and content[j].isspace():
+            if content[j] == "\n":
+                last_nl = j
+            j += 1
+        if last_nl != -1:
+            return content[4:end], content[last_nl + 1 :]
+        end = content.find("\n---", end + 1)
+    return None
+
+
 def _strip_frontmatter(content: str) -> str:
     """Strip YAML frontmatter from markdown content.
 
@@ -53,44 +104,49 @@ def _strip_frontmatter(content: str) -> str:
     Raises:
         CriticStepError: If frontmatter is malformed or missing.
     """
-    # Match YAML frontmatter between --- markers at the start
-    frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
+    # Nearly every section starts with exactly "---\n"; only content that
+    # does not (extra whitespace around the opening fence) pays for the regex.
+    if content.startswith("---\n") and not content[4:5].isspace():
+        split = _split_frontmatter_fast(content)
+    else:
+        match = _FRONTMATTER_RE.match(content)
+        split = (match.group(1), match.group(2)) if match else None
 
-    if not match:
+    if split is None:
         raise CriticStepError(
             "Section content missing valid YAML frontmatter "
             "(expected --- markers at the top)"
         )
 
-    frontmatter_text = match.group(1)
-    markdown_body = match.group(2)
+    frontmatter_text, markdown_body = split
 
     # Validate that frontmatter is valid YAML
     try:
-        yaml.safe_load(frontmatter_text)
+        yaml.load(frontmatter_text, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise CriticStepError(f"Invalid YAML in frontmatter: {e}") from e
 
     return markdown_body
 
 
-def _load_all_sections(run_dir: Path, expected_section_count: int) -> str:
-    """Load and concatenate all section artifacts into a full draft.
+def _load_all_sections(run_dir: Path, expected_section_count: int) -> list[str]:
+    """Load all section artifacts as the parts of the full draft.
 
-    Loads all section files (20_section_<NN>.md) in order, strips frontmatter,
-    and concatenates them into a single draft.
+    Loads all section files (20_section_<NN>.md) in order and strips
+    frontmatter. The caller joins the parts into the draft when it builds
+    the prompt variables.
 
     Args:
         run_dir: Path to the run directory.
         expected_section_count: Expected number of sections (from outline length).
 
     Returns:
-        Full draft text (all sections concatenated).
+        Section bodies in section order (join with blank lines for the draft).
 
     Raises:
         CriticStepError: If sections are missing, numbering has gaps, or files
-            cannot be read.
+            cannot be read or lack frontmatter (all such sections are listed
+            in a single error).
     """
     artifacts_dir = run_dir / "artifacts"
     if not artifacts_dir.exists():
@@ -100,16 +156,19 @@ def _load_all_sections(run_dir: Path, expected_section_count: int) -> str:
         )
 
     # Find all section files
-    section_pattern = re.compile(r"^20_section_(\d+)\.md$")
     section_files: list[tuple[int, Path]] = []
 
-    for file_path in artifacts_dir.iterdir():
-        if not file_path.is_file():
-            continue
-        match = section_pattern.match(file_path.name)
-        if match:
-            section_num = int(match.group(1))
-            section_files.append((section_num, file_path))
+    # Match 20_section_<digits>.md by prefix/suffix before touching the entry;
+    # DirEntry.is_file() reuses the type scandir already read where possible.
+    with os.scandir(artifacts_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("20_section_") and name.endswith(".md")):
+                continue
+            digits = name[11:-3]
+            if not digits.isdecimal() or not entry.is_file():
+                continue
+            section_files.append((int(digits), Path(entry.path)))
 
     if not section_files:
         raise CriticStepError(
@@ -119,45 +178,63 @@ def _load_all_sections(run_dir: Path, expected_section_count: int) -> str:
         )
 
     # Sort by section number
-    section_files.sort(key=lambda x: x[0])
-
-    # Check for gaps in numbering based on expected count
-    expected_nums = set(range(1, expected_section_count + 1))
-    actual_nums = {num for num, _ in section_files}
-    missing_nums = sorted(expected_nums - actual_nums)
-
-    if missing_nums:
-        missing_list = ", ".join(str(n) for n in missing_nums)
-        raise CriticStepError(
-            f"Section numbering has gaps. Missing section indices: {missing_list}. "
-            f"Found sections: {sorted(actual_nums)}. "
-            f"Expected {expected_section_count} sections based on outline. "
-            "All sections must be generated before running the critic step. "
-            "Check that the 'section' pipeline step completed successfully."
-        )
+    section_files.sort(key=itemgetter(0))
+
+    # Check for gaps in numbering based on expected count. Common case: the
+    # first N sorted entries are exactly 1..N, so nothing can be missing.
+    contiguous = len(section_files) >= expected_section_count and all(
+        section_files[i][0] == i + 1 for i in range(expected_section_count)
+    )
+    if not contiguous:
+        expected_nums = set(range(1, expected_section_count + 1))
+        actual_nums = {num for num, _ in section_files}
+        missing_nums = sorted(expected_nums - actual_nums)
+
+        if missing_nums:
+            missing_list = ", ".join(str(n) for n in missing_nums)
+            raise CriticStepError(
+                f"Section numbering has gaps. Missing section indices: {missing_list}. "
+                f"Found sections: {sorted(actual_nums)}. "
+                f"Expected {expected_section_count} sections based on outline. "
+                "All sections must be generated before running the critic step. "
+                "Check that the 'section' pipeline step completed successfully."
+            )
 
-    # Load and concatenate sections
+    # Every section is checked before failing, so one run reports all
+    # broken artifacts.
     draft_parts: list[str] = []
+    errors: list[tuple[str, Exception]] = []
     for section_num, file_path in section_files:
         try:
             content = file_path.read_text(encoding="utf-8")
-        except OSError as e:
-            raise CriticStepError(
-                f"Error reading section artifact {file_path.name} "
-                f"(section {section_num}): {e}. "
-                "Pipeline step 'section' may have failed partially."
-            ) from e
+        except (OSError, UnicodeDecodeError) as e:
+            errors.append(
+                (
+                    f"Error reading section artifact {file_path.name} "
+                    f"(section {section_num}): {e}. "
+                    "Pipeline step 'section' may have failed partially.",
+                    e,
+                )
+            )
+            continue
 
         try:
-            body = _strip_frontmatter(content)
+            draft_parts.append(_strip_frontmatter(content))
         except CriticStepError as e:
-            raise CriticStepError(
-                f"Error processing section {section_num} ({file_path.name}): {e}"
-            ) from e
+            errors.append(
+                (f"Error processing section {section_num} ({file_path.name}): {e}", e)
+            )
 
-        draft_parts.append(body)
+    if len(errors) == 1:
+        message, cause = errors[0]
+        raise CriticStepError(message) from cause
+    if errors:
+        details = "\n".join(f"- {message}" for message, _ in errors)
+        raise CriticStepError(
+            f"{len(errors)} section artifacts could not be loaded:\n{details}"
+        ) from errors[0][1]
 
-    return "\n\n".join(draft_parts)
+    return draft_parts
 
 
 def _coerce_critic_json_block(
@@ -182,26 +259,26 @@ def _coerce_critic_json_block(
     Raises:
         CriticStepError: If required fields are missing or have wrong types.
     """
-    required = frozenset({"issues_found", "changes_applied"})
-
     json_script: str | None = None
     fs_top = parsed.get("final_script")
     if isinstance(fs_top, str) and fs_top.strip():
         json_script = fs_top
 
     candidate: dict[str, Any]
-    if required <= parsed.keys():
+    if parsed.keys() >= _EDITOR_REPORT_REQUIRED_KEYS:
         candidate = dict(parsed)
         candidate.pop("final_script", None)
     else:
         inner = parsed.get("editor_report")
-        if not isinstance(inner, dict) or not (required <= inner.keys()):
+        if not (
+            isinstance(inner, dict) and inner.keys() >= _EDITOR_REPORT_REQUIRED_KEYS
+        ):
+            required = sorted(_EDITOR_REPORT_REQUIRED_KEYS)
             raise CriticStepError(
-                f"editor_report missing required keys: {sorted(required)}. "
+                f"editor_report missing required keys: {required}. "
                 f"Found keys: {sorted(parsed.keys())}. "
-                "Expected either a JSON object with 'issues_found' and "
-                "'changes_applied', or an object with an 'editor_report' property "
-                "containing those keys."
+                f"Expected either a JSON object with {' and '.join(map(repr, required))}, "
+                "or an object with an 'editor_report' property containing those keys."
             )
         candidate = dict(inner)
         fs_inner = candidate.pop("final_script", None)
@@ -277,10 +354,9 @@ def _parse_two_block_response(content: str) -> tuple[str, dict[str, Any]]:
     ):
         script_content_start += 1
 
-    # Extract up to (but not including) the editor report marker
-    script_content = content[script_content_start:report_start]
-    # Remove trailing whitespace
-    final_script = script_content.rstrip()
+    # Extract up to (but not including) the editor report marker, minus
+    # trailing whitespace
+    final_script = content[script_content_start:report_start].rstrip()
 
     # Extract editor_report (JSON block)
     report_content_start = report_start + len(editor_report_marker)
@@ -359,6 +435,7 @@ def execute_critic_step(
             StateIOError,
             load_state,
             update_state_atomic,
+            write_atomic,
         )
 
         try:
@@ -373,7 +450,7 @@ def execute_critic_step(
 
         # Load all sections and combine into full draft
         expected_section_count = len(outline)
-        full_draft = _load_all_sections(run_dir, expected_section_count)
+        draft_parts = _load_all_sections(run_dir, expected_section_count)
 
         # Get seed from state
         seed = state.get("seed")
@@ -394,7 +471,7 @@ def execute_critic_step(
         language = state.get("language", "en")
         prompt_vars = {
             "seed": seed,
-            "full_draft": full_draft,
+            "full_draft": "\n\n".join(draft_parts),
             "lore_bible": context_vars["lore_bible"],
             "style_rules": context_vars["style_rules"],
             "outline": json.dumps(outline, indent=2),
@@ -504,18 +581,7 @@ def execute_critic_step(
 
         # Validate editor_report against schema
         if schema_base is None:
-            # Default to src/llm_storytell/schemas relative to project root
-            current = Path.cwd()
-            project_root = None
-            for parent in [current] + list(current.parents):
-                if (parent / "SPEC.md").exists() or (
-                    parent / "pyproject.toml"
-                ).exists():
-                    project_root = parent
-                    break
-            if project_root is None:
-                project_root = Path(__file__).parent.parent.parent.parent
-            schema_base_path = project_root / "src" / "llm_storytell" / "schemas"
+            schema_base_path = default_schema_base()
         else:
             schema_base_path = Path(schema_base)
 
@@ -531,54 +597,23 @@ def execute_critic_step(
 
         # Write final_script.md
         final_script_path = artifacts_dir / "final_script.md"
-        temp_file = None
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=artifacts_dir,
-                delete=False,
-                suffix=".tmp",
-            ) as f:
-                temp_file = Path(f.name)
-                f.write(final_script)
-
-            temp_file.replace(final_script_path)
-            temp_file = None
-
-            # Log artifact creation
-            size_bytes = final_script_path.stat().st_size
+            size_bytes = write_atomic(final_script_path, final_script)
             logger.log_artifact_write(Path("artifacts") / "final_script.md", size_bytes)
         except OSError as e:
-            if temp_file and temp_file.exists():
-                temp_file.unlink()
             raise CriticStepError(f"Error writing final_script.md: {e}") from e
 
         # Write editor_report.json
         editor_report_path = artifacts_dir / "editor_report.json"
-        temp_file = None
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=artifacts_dir,
-                delete=False,
-                suffix=".tmp",
-            ) as f:
-                temp_file = Path(f.name)
-                json.dump(editor_report, f, indent=2, ensure_ascii=False)
-
-            temp_file.replace(editor_report_path)
-            temp_file = None
-
-            # Log artifact creation
-            size_bytes = editor_report_path.stat().st_size
+            size_bytes = write_atomic(
+                editor_report_path,
+                json.dumps(editor_report, indent=2, ensure_ascii=False),
+            )
             logger.log_artifact_write(
                 Path("artifacts") / "editor_report.json", size_bytes
             )
         except OSError as e:
-            if temp_file and temp_file.exists():
-                temp_file.unlink()
             raise CriticStepError(f"Error writing editor_report.json: {e}") from e
 
         # Record token usage
@@ -590,6 +625,7 @@ def execute_critic_step(
             prompt_tokens=result.prompt_tokens or 0,
             completion_tokens=result.completion_tokens or 0,
             total_tokens=result.total_tokens,
+            state=state,
         )
 
         # Update state with paths (relative to run_dir, normalized to forward slashes)
@@ -598,8 +634,10 @@ def execute_critic_step(
             s["editor_report_path"] = Path("artifacts/editor_report.json").as_posix()
             s["token_usage"].append(token_usage_dict)
 
+        # Nothing else writes state.json during this step, so reuse the state
+        # loaded above instead of reading and parsing it again.
         try:
-            update_state_atomic(run_dir, updater)
+            update_state_atomic(run_dir, updater, state=state)
         except StateIOError as e:
             raise CriticStepError(str(e)) from e
 
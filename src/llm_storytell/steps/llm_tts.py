@@ -83,17 +83,9 @@ def _chunk_text(
     return segments, imperfect
 
 
-def _load_final_script(run_dir: Path) -> str:
+def _load_final_script(run_dir: Path, state: dict[str, Any] | None) -> str:
     """Load final script from run_dir (artifacts/final_script.md or state path)."""
-    from llm_storytell.pipeline.state import StateIOError, load_state
-
-    path_from_state: str | None = None
-    try:
-        state = load_state(run_dir)
-        path_from_state = state.get("final_script_path")
-    except StateIOError:
-        pass
-
+    path_from_state = state.get("final_script_path") if state else None
     if path_from_state:
         script_path = run_dir / path_from_state
     else:
@@ -137,8 +129,22 @@ def execute_llm_tts_step(
     Raises:
         LLMTTSStepError: On missing input, chunking failure, or TTS error.
     """
+    from llm_storytell.pipeline.state import (
+        StateIOError,
+        load_state,
+        update_state_atomic,
+    )
+
     run_dir = run_dir.resolve()
-    text = _load_final_script(run_dir)
+    # Loaded once: gives the script path, the text-token totals, and the
+    # base for the final tts_token_usage update.
+    state: dict[str, Any] | None
+    try:
+        state = load_state(run_dir)
+    except StateIOError:
+        state = None
+
+    text = _load_final_script(run_dir, state)
     segments, imperfect_flags = _chunk_text(text)
 
     if len(segments) < 1:
@@ -154,22 +160,12 @@ def execute_llm_tts_step(
     prompts_dir.mkdir(parents=True, exist_ok=True)
     outputs_dir.mkdir(parents=True, exist_ok=True)
 
-    from llm_storytell.pipeline.state import (
-        StateIOError,
-        load_state,
-        update_state_atomic,
-    )
-
     total_text_prompt = 0
     total_text_completion = 0
-    try:
-        s = load_state(run_dir)
-        for entry in s.get("token_usage") or []:
-            if isinstance(entry, dict):
-                total_text_prompt += entry.get("prompt_tokens", 0) or 0
-                total_text_completion += entry.get("completion_tokens", 0) or 0
-    except StateIOError:
-        pass
+    for entry in (state or {}).get("token_usage") or []:
+        if isinstance(entry, dict):
+            total_text_prompt += entry.get("prompt_tokens", 0) or 0
+            total_text_completion += entry.get("completion_tokens", 0) or 0
 
     tts_usage_entries: list[dict[str, Any]] = []
     tts_prompt_sum = 0
@@ -253,7 +249,7 @@ def execute_llm_tts_step(
         s.setdefault("tts_token_usage", []).extend(tts_usage_entries)
 
     try:
-        update_state_atomic(run_dir, updater)
+        update_state_atomic(run_dir, updater, state=state)
     except StateIOError as e:
         raise LLMTTSStepError(str(e)) from e
 
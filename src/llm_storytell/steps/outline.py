@@ -5,7 +5,6 @@ and app context, validates the output, and persists it to artifacts and state.
 """
 
 import json
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -20,7 +19,11 @@ from llm_storytell.prompt_render import (
     UnsupportedPlaceholderError,
     render_prompt,
 )
-from llm_storytell.schemas import SchemaValidationError, validate_json_schema
+from llm_storytell.schemas import (
+    SchemaValidationError,
+    default_schema_base,
+    validate_json_schema,
+)
 from llm_storytell.steps.llm_io import save_llm_io
 
 
@@ -62,6 +65,7 @@ def execute_outline_step(
             load_inputs,
             load_state,
             update_state_atomic,
+            write_atomic,
         )
 
         try:
@@ -77,7 +81,8 @@ def execute_outline_step(
         beats_count = inputs.get("beats")
         if beats_count is None:
             raise OutlineStepError("Beats count not found in inputs.json")
-        if not isinstance(beats_count, int) or beats_count < 1 or beats_count > 20:
+        # Exact type check: bool is an int subclass but not a valid count
+        if type(beats_count) is not int or not 1 <= beats_count <= 20:
             raise OutlineStepError(f"Invalid beats count: {beats_count} (must be 1-20)")
 
         # Load context files (shared contract: lore_bible, style, location, characters)
@@ -88,9 +93,6 @@ def execute_outline_step(
 
         # Load and render prompt template
         prompt_path = prompts_dir / "10_outline.md"
-        if not prompt_path.exists():
-            raise OutlineStepError(f"Prompt template not found: {prompt_path}")
-
         language = state.get("language", "en")
         prompt_vars = {
             "seed": seed,
@@ -106,7 +108,9 @@ def execute_outline_step(
             rendered_prompt = render_prompt(prompt_path, prompt_vars)
             print("[outline] Prompt rendered successfully")
         except TemplateNotFoundError as e:
-            raise OutlineStepError(f"Prompt template not found: {e}") from e
+            raise OutlineStepError(
+                f"Prompt template not found: {e.template_path}"
+            ) from e
         except MissingVariableError as e:
             raise OutlineStepError(f"Missing variables in prompt template: {e}") from e
         except UnsupportedPlaceholderError as e:
@@ -225,6 +229,15 @@ def execute_outline_step(
                 f"Outline 'beats' must be an array, got {type(beats).__name__}"
             )
 
+        # Beat count first: the cheapest check and a common reason for retries,
+        # so a wrong count fails before the per-beat and schema walks
+        if len(beats) != beats_count:
+            error_msg = (
+                f"Outline has {len(beats)} beats, but {beats_count} were requested"
+            )
+            logger.log_validation_failure(step="outline", error=error_msg)
+            raise OutlineStepError(error_msg)
+
         for idx, beat in enumerate(beats):
             if not isinstance(beat, dict):
                 raise OutlineStepError(
@@ -248,21 +261,7 @@ def execute_outline_step(
 
         # Validate against schema
         if schema_base is None:
-            # Default to src/llm_storytell/schemas relative to project root
-            # Find project root by looking for SPEC.md or pyproject.toml
-            current = Path.cwd()
-            project_root = None
-            for parent in [current] + list(current.parents):
-                if (parent / "SPEC.md").exists() or (
-                    parent / "pyproject.toml"
-                ).exists():
-                    project_root = parent
-                    break
-            if project_root is None:
-                # Fallback: assume we're in src/llm_storytell/steps
-                # and go up to project root
-                project_root = Path(__file__).parent.parent.parent.parent
-            schema_base_path = project_root / "src" / "llm_storytell" / "schemas"
+            schema_base_path = default_schema_base()
         else:
             schema_base_path = Path(schema_base)
 
@@ -272,42 +271,17 @@ def execute_outline_step(
         except SchemaValidationError as e:
             raise OutlineStepError(f"Schema validation failed: {e}") from e
 
-        # Validate beat count matches requested count
-        beats = outline_data.get("beats", [])
-        if len(beats) != beats_count:
-            error_msg = (
-                f"Outline has {len(beats)} beats, but {beats_count} were requested"
-            )
-            logger.log_validation_failure(step="outline", error=error_msg)
-            raise OutlineStepError(error_msg)
-
         # Write artifact
         artifacts_dir = run_dir / "artifacts"
         artifacts_dir.mkdir(exist_ok=True)
         artifact_path = artifacts_dir / "10_outline.json"
 
-        # Atomic write
-        temp_file = None
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=artifacts_dir,
-                delete=False,
-                suffix=".tmp",
-            ) as f:
-                temp_file = Path(f.name)
-                json.dump(outline_data, f, indent=2, ensure_ascii=False)
-
-            temp_file.replace(artifact_path)
-            temp_file = None
-
-            # Log artifact creation
-            size_bytes = artifact_path.stat().st_size
+            size_bytes = write_atomic(
+                artifact_path, json.dumps(outline_data, indent=2, ensure_ascii=False)
+            )
             logger.log_artifact_write(Path("artifacts") / "10_outline.json", size_bytes)
         except OSError as e:
-            if temp_file and temp_file.exists():
-                temp_file.unlink()
             raise OutlineStepError(f"Error writing outline artifact: {e}") from e
 
         # Record token usage
@@ -319,6 +293,7 @@ def execute_outline_step(
             prompt_tokens=result.prompt_tokens or 0,
             completion_tokens=result.completion_tokens or 0,
             total_tokens=result.total_tokens,
+            state=state,
         )
 
         # Update state
@@ -327,7 +302,7 @@ def execute_outline_step(
             s["token_usage"].append(token_usage_dict)
 
         try:
-            update_state_atomic(run_dir, updater)
+            update_state_atomic(run_dir, updater, state=state)
         except StateIOError as e:
             raise OutlineStepError(str(e)) from e
 
@@ -6,7 +6,6 @@ summary and continuity ledger to maintain narrative consistency.
 
 import json
 import re
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -23,7 +22,12 @@ from llm_storytell.prompt_render import (
     TemplateNotFoundError,
     render_prompt,
 )
-from llm_storytell.schemas import SchemaValidationError, validate_json_schema
+from llm_storytell.schemas import (
+    SchemaValidationError,
+    default_schema_base,
+    load_schema,
+    validate_json_schema,
+)
 from llm_storytell.steps.llm_io import save_llm_io
 
 
@@ -38,24 +42,15 @@ def _resolve_section_schema_path(
 ) -> Path:
     """Return path to section.schema.json (same rules as validation block)."""
     if schema_base is None:
-        current = Path.cwd()
-        project_root = None
-        for parent in [current] + list(current.parents):
-            if (parent / "SPEC.md").exists() or (parent / "pyproject.toml").exists():
-                project_root = parent
-                break
-        if project_root is None:
-            project_root = Path(__file__).parent.parent.parent.parent
-        schema_base_path = project_root / "src" / "llm_storytell" / "schemas"
+        schema_base_path = default_schema_base()
     else:
         schema_base_path = Path(schema_base)
     return schema_base_path / "section.schema.json"
 
 
 def _section_local_summary_min_len(schema_path: Path) -> int:
-    """Read minLength for local_summary from section.schema.json."""
-    with schema_path.open(encoding="utf-8") as f:
-        schema = json.load(f)
+    """Read minLength for local_summary from section.schema.json (cached)."""
+    schema = load_schema(schema_path)
     return int(schema["properties"]["local_summary"]["minLength"])
 
 
@@ -152,6 +147,7 @@ def execute_section_step(
             StateIOError,
             load_state,
             update_state_atomic,
+            write_atomic,
         )
 
         try:
@@ -248,7 +244,7 @@ def execute_section_step(
         schema_path = _resolve_section_schema_path(schema_base)
         try:
             min_local_summary = _section_local_summary_min_len(schema_path)
-        except (KeyError, TypeError, OSError, json.JSONDecodeError) as e:
+        except (KeyError, TypeError, OSError, SchemaValidationError) as e:
             raise SectionStepError(f"Cannot read section schema: {e}") from e
 
         schema_fields = {
@@ -385,28 +381,10 @@ def execute_section_step(
         artifact_filename = f"20_section_{section_id:02d}.md"
         artifact_path = artifacts_dir / artifact_filename
 
-        # Atomic write
-        temp_file = None
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=artifacts_dir,
-                delete=False,
-                suffix=".tmp",
-            ) as f:
-                temp_file = Path(f.name)
-                f.write(full_section_content)
-
-            temp_file.replace(artifact_path)
-            temp_file = None
-
-            # Log artifact creation
-            size_bytes = artifact_path.stat().st_size
+            size_bytes = write_atomic(artifact_path, full_section_content)
             logger.log_artifact_write(Path("artifacts") / artifact_filename, size_bytes)
         except OSError as e:
-            if temp_file and temp_file.exists():
-                temp_file.unlink()
             raise SectionStepError(f"Error writing section artifact: {e}") from e
 
         # Record token usage (sums both calls if a local_summary repair ran)
@@ -418,6 +396,7 @@ def execute_section_step(
             prompt_tokens=accum_prompt,
             completion_tokens=accum_completion,
             total_tokens=total_tokens_sum,
+            state=state,
         )
 
         # Update state with section metadata
@@ -428,7 +407,7 @@ def execute_section_step(
             s["token_usage"].append(token_usage_dict)
 
         try:
-            update_state_atomic(run_dir, updater)
+            update_state_atomic(run_dir, updater, state=state)
         except StateIOError as e:
             raise SectionStepError(str(e)) from e
 
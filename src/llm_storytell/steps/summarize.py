@@ -18,7 +18,11 @@ from llm_storytell.prompt_render import (
     TemplateNotFoundError,
     render_prompt,
 )
-from llm_storytell.schemas import SchemaValidationError, validate_json_schema
+from llm_storytell.schemas import (
+    SchemaValidationError,
+    default_schema_base,
+    validate_json_schema,
+)
 from llm_storytell.steps.llm_io import save_llm_io
 
 
@@ -46,16 +50,20 @@ def _load_section_artifact(run_dir: Path, section_index: int) -> str:
     artifact_filename = f"20_section_{section_id:02d}.md"
     artifact_path = run_dir / "artifacts" / artifact_filename
 
-    if not artifact_path.exists():
+    try:
+        with artifact_path.open("rb") as f:
+            content = f.read().decode("utf-8")
+    except FileNotFoundError:
         raise SummarizeStepError(
             f"Section artifact not found: {artifact_path} "
             f"(section_index={section_index})"
-        )
-
-    try:
-        return artifact_path.read_text(encoding="utf-8")
+        ) from None
     except OSError as e:
         raise SummarizeStepError(f"Error reading section artifact: {e}") from e
+    if "\r" in content:
+        # Match text-mode reads (universal newlines)
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 def execute_summarize_step(
@@ -105,9 +113,6 @@ def execute_summarize_step(
 
         # Load and render prompt template
         prompt_path = prompts_dir / "21_summarize.md"
-        if not prompt_path.exists():
-            raise SummarizeStepError(f"Prompt template not found: {prompt_path}")
-
         prompt_vars = {
             "section_id": section_id,
             "section_content": section_content,
@@ -116,7 +121,9 @@ def execute_summarize_step(
         try:
             rendered_prompt = render_prompt(prompt_path, prompt_vars)
         except TemplateNotFoundError as e:
-            raise SummarizeStepError(f"Prompt template not found: {e}") from e
+            raise SummarizeStepError(
+                f"Prompt template not found: {e.template_path}"
+            ) from e
         except MissingVariableError as e:
             raise SummarizeStepError(
                 f"Missing variables in prompt template: {e}"
@@ -203,18 +210,7 @@ def execute_summarize_step(
 
         # Validate against schema
         if schema_base is None:
-            # Default to src/llm_storytell/schemas relative to project root
-            current = Path.cwd()
-            project_root = None
-            for parent in [current] + list(current.parents):
-                if (parent / "SPEC.md").exists() or (
-                    parent / "pyproject.toml"
-                ).exists():
-                    project_root = parent
-                    break
-            if project_root is None:
-                project_root = Path(__file__).parent.parent.parent.parent
-            schema_base_path = project_root / "src" / "llm_storytell" / "schemas"
+            schema_base_path = default_schema_base()
         else:
             schema_base_path = Path(schema_base)
 
@@ -224,14 +220,11 @@ def execute_summarize_step(
         except SchemaValidationError as e:
             raise SummarizeStepError(f"Schema validation failed: {e}") from e
 
-        # Merge continuity updates into ledger
-        current_ledger = state.get("continuity_ledger", {})
         continuity_updates = summary_data.get("continuity_updates", {})
         if not isinstance(continuity_updates, dict):
             raise SummarizeStepError(
                 "continuity_updates must be a dictionary in summary data"
             )
-        updated_ledger = merge_continuity_updates(current_ledger, continuity_updates)
 
         # Record token usage
         token_usage_dict = record_token_usage(
@@ -242,6 +235,7 @@ def execute_summarize_step(
             prompt_tokens=result.prompt_tokens or 0,
             completion_tokens=result.completion_tokens or 0,
             total_tokens=result.total_tokens,
+            state=state,
         )
 
         # Update state
@@ -249,11 +243,13 @@ def execute_summarize_step(
             if "summaries" not in s:
                 s["summaries"] = []
             s["summaries"].append(summary_data)
-            s["continuity_ledger"] = updated_ledger
+            merge_continuity_updates(
+                s.setdefault("continuity_ledger", {}), continuity_updates
+            )
             s["token_usage"].append(token_usage_dict)
 
         try:
-            update_state_atomic(run_dir, updater)
+            update_state_atomic(run_dir, updater, state=state)
         except StateIOError as e:
             raise SummarizeStepError(str(e)) from e
 
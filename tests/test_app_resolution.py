@@ -110,6 +110,21 @@ class TestResolveApp:
         with pytest.raises(AttributeError):
             result.app_name = "other-app"  # type: ignore[misc]
 
+    def test_relative_base_dir_is_made_absolute(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A relative base_dir is resolved against the cwd, without realpath."""
+        apps_context = tmp_path / "apps" / "my-app" / "context"
+        apps_context.mkdir(parents=True)
+        (apps_context / "lore_bible.md").write_text("# Lore")
+        monkeypatch.chdir(tmp_path)
+
+        assert resolve_app("my-app", Path(".")).context_dir.is_absolute()
+        assert (
+            resolve_app("my-app").context_dir
+            == resolve_app("my-app", Path(".")).context_dir
+        )
+
 
 class TestAppNotFoundError:
     """Tests for the AppNotFoundError exception."""
@@ -6,7 +6,15 @@ from unittest.mock import patch
 
 import pytest
 
-from llm_storytell.cli import create_parser, main
+from llm_storytell.cli import (
+    _HELP_TEXT,
+    CLIError,
+    _coerce_run_args,
+    _sniff_subcommand,
+    create_parser,
+    main,
+    parse_run_args,
+)
 from llm_storytell.pipeline.state import update_state_selected_context
 
 
@@ -53,6 +61,165 @@ def test_parser_accepts_language() -> None:
     assert getattr(args, "language", None) == "es"
 
 
+def test_help_text_matches_argparse(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Precomputed help is identical to argparse's top-level help."""
+    monkeypatch.setenv("COLUMNS", "80")
+    assert _HELP_TEXT == create_parser().format_help()
+
+
+@pytest.mark.parametrize("argv", [[], ["-h"], ["--help"]])
+def test_help_printed_without_parser(
+    argv: list[str], capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Bare, -h and --help invocations print the help and exit 0."""
+    with patch("llm_storytell.cli.create_parser") as create:
+        assert main(argv) == 0
+    create.assert_not_called()
+    assert capsys.readouterr().out == _HELP_TEXT
+
+
+def test_sniff_subcommand() -> None:
+    """_sniff_subcommand returns argv[0] if it is a known subcommand, else None."""
+    assert _sniff_subcommand(["run", "--app", "a"]) == "run"
+    assert _sniff_subcommand(["audio-prep", "--run-dir", "x"]) == "audio-prep"
+    assert _sniff_subcommand(["--help"]) is None
+    assert _sniff_subcommand(["bogus", "run"]) is None
+    assert _sniff_subcommand([]) is None
+
+
+def test_unknown_subcommand_is_reported_by_full_parser(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A later 'run' token does not select the run parser for a bad command."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["bogus", "run"])
+    assert exc_info.value.code == 2
+    err = capsys.readouterr().err
+    assert "invalid choice: 'bogus'" in err
+    assert "audio-prep" in err
+
+
+def test_parser_for_subcommand_builds_only_that_subcommand() -> None:
+    """create_parser('run') parses run args but does not know audio-prep."""
+    parser = create_parser("run")
+    args = parser.parse_args(["run", "--app", "a", "--seed", "s"])
+    assert args.command == "run"
+    with pytest.raises(SystemExit):
+        parser.parse_args(["audio-prep", "--run-dir", "x"])
+
+
+def test_parse_run_args_matches_argparse() -> None:
+    """Fast run parser yields the same attributes as the argparse parser."""
+    argv = [
+        "run",
+        "--app",
+        "a",
+        "--seed",
+        "s",
+        "--beats",
+        "3",
+        "--config-path",
+        "cfg",
+        "--word-count",
+        "1200",
+        "--no-tts",
+        "--language",
+        "es",
+        "--delivery",
+    ]
+    fast = parse_run_args(argv)
+    slow = create_parser().parse_args(argv)
+    assert vars(fast) == vars(slow)
+
+
+def test_parse_run_args_accepts_equals_form() -> None:
+    """--option=value is handled by the fast parser like argparse does."""
+    argv = ["run", "--app=a", "--seed=s=1", "--beats", "3", "--language=", "--tts"]
+    fast = parse_run_args(argv)
+    slow = create_parser().parse_args(argv)
+    assert vars(fast) == vars(slow)
+    assert fast.seed == "s=1"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["run", "--seed", "s"],
+        ["run", "--app", "a", "--unknown"],
+        ["run", "--app"],
+        ["run", "--app", "a", "--help"],
+        ["run", "--app", "a", "--tts=1"],
+    ],
+)
+def test_parse_run_args_rejects_unusual_argv(argv: list[str]) -> None:
+    """Fast run parser defers anything unusual to argparse via CLIError."""
+    with pytest.raises(CLIError):
+        parse_run_args(argv)
+
+
+def test_coerce_run_args_converts_ints_and_config_path() -> None:
+    """Raw option strings become int/Path once, for either parser."""
+    for parse in (parse_run_args, create_parser().parse_args):
+        args = parse(["run", "--app", "a", "--beats", "3", "--word-count", "900"])
+        assert _coerce_run_args(args) is None
+        assert args.beats == 3
+        assert args.word_count == 900
+        assert args.sections is None
+        assert args.config_path == Path("config")
+
+
+def test_run_non_integer_beats_exits_nonzero(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A non-integer --beats is reported before any app resolution."""
+    exit_code = main(["run", "--app", "a", "--seed", "s", "--beats", "x"])
+    assert exit_code == 1
+    assert "--beats must be an integer" in capsys.readouterr().err
+
+
+def test_run_missing_seed_prints_full_help(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A missing --seed prints the same top-level help as bare invocations."""
+    exit_code = main(["run", "--app", "a"])
+    assert exit_code == 1
+    captured = capsys.readouterr()
+    assert "--seed is required" in captured.err
+    assert captured.out == _HELP_TEXT
+
+
+@pytest.mark.parametrize(
+    ("extra", "message"),
+    [
+        (["--word-count", "50"], "--word-count must be greater than 100"),
+        (["--word-count", "5000", "--beats", "2"], "must be less than 1000"),
+        (["--beats", "21"], "--beats must be between 1 and 20"),
+        (["--language", "not-a-code"], "Invalid --language"),
+    ],
+)
+def test_run_argument_errors_reported_before_app_resolution(
+    extra: list[str],
+    message: str,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Argument-only errors win over a missing app; nothing is resolved."""
+    with patch("llm_storytell.cli.resolve_app_or_exit") as resolve:
+        exit_code = main(["run", "--app", "missing", "--seed", "s", *extra])
+    assert exit_code == 1
+    assert message in capsys.readouterr().err
+    resolve.assert_not_called()
+
+
+def test_run_unknown_flag_falls_back_to_argparse_error(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Unknown run flags still produce argparse's usage error (exit 2)."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["run", "--app", "a", "--seed", "s", "--bogus"])
+    assert exc_info.value.code == 2
+    assert "unrecognized arguments" in capsys.readouterr().err
+
+
 def test_parser_accepts_delivery() -> None:
     """Parser accepts --delivery."""
     parser = create_parser()
@@ -408,3 +575,19 @@ def test_audio_prep_invokes_execute_step(
     assert len(calls) == 1
     assert calls[0][0] == run_dir.resolve()
     assert calls[0][1] == tmp_path.resolve()
+
+
+def test_importing_cli_does_not_import_runner_or_sdks() -> None:
+    """The runner, step modules and HTTP stack load only when a run starts."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, llm_storytell.cli; "
+        "print(sorted(m for m in ('llm_storytell.pipeline.runner', "
+        "'llm_storytell.steps.critic', 'httpx') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
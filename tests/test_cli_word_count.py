@@ -22,3 +22,10 @@ class TestSectionLengthMidpoint:
         """Invalid or unparseable string falls back to 500."""
         assert _section_length_midpoint("invalid") == 500
         assert _section_length_midpoint("") == 500
+
+    def test_non_positive_or_descending_fallback_500(self) -> None:
+        """Zero, negative and descending values fall back to 500."""
+        assert _section_length_midpoint("0") == 500
+        assert _section_length_midpoint("-5") == 500
+        assert _section_length_midpoint("600-400") == 500
+        assert _section_length_midpoint(" 300 - 500 ") == 400
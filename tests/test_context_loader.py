@@ -134,6 +134,19 @@ class TestContextLoader:
         assert "lore_bible.md" in selection.always_loaded
         assert len([k for k in selection.always_loaded if k != "lore_bible.md"]) == 0
 
+    def test_batched_read_failure_names_the_file(self, tmp_path: Path) -> None:
+        """An unreadable file in the lore/style batch is reported by path."""
+        context_dir = tmp_path / "context" / "test-app"
+        (context_dir / "style" / "broken.md").mkdir(parents=True)
+        (context_dir / "style" / "a.md").write_text("# A")
+        (context_dir / "lore_bible.md").write_text("# Lore Bible")
+        (context_dir / "characters").mkdir()
+        (context_dir / "characters" / "one.md").write_text("# One")
+
+        loader = ContextLoader(context_dir)
+        with pytest.raises(ContextLoaderError, match="Failed to read .*broken.md"):
+            loader.load_context("run-test-004b")
+
     def test_selects_one_location_random(self, temp_context_dir: Path) -> None:
         """Selects exactly one location file at random from locations/."""
         valid_locations = {
@@ -244,6 +257,23 @@ class TestContextLoader:
         assert selection1.selected_characters == selection2.selected_characters
         assert selection1.world_files == selection2.world_files
 
+    def test_selection_seed_is_stable_and_leaves_global_random(
+        self, temp_context_dir: Path
+    ) -> None:
+        """run_id seeds the same sequence as before; the random module is untouched."""
+        import hashlib
+        import random
+
+        run_id = "run-reproducible-001"
+        legacy_seed = int(hashlib.md5(run_id.encode()).hexdigest()[:8], 16)
+        expected = random.Random(legacy_seed)
+        rng = loader_module._rng_from_run_id(run_id)
+        assert [rng.random() for _ in range(3)] == [expected.random() for _ in range(3)]
+
+        before = random.getstate()
+        ContextLoader(temp_context_dir).load_context(run_id)
+        assert random.getstate() == before
+
     def test_logs_selections(self, temp_context_dir: Path, tmp_path: Path) -> None:
         """Logs context selections when logger is provided."""
         log_path = tmp_path / "test.log"
@@ -418,6 +448,75 @@ class TestContextLoader:
             assert len(vars_out["location_context"]) > 0
         assert len(vars_out["character_context"]) > 0
 
+    def test_build_prompt_context_vars_assembles_in_order(self, tmp_path: Path) -> None:
+        """Concurrently read files are assembled in the documented order."""
+        context_dir = tmp_path / "context"
+        for sub in ("world", "style", "locations", "characters"):
+            (context_dir / sub).mkdir(parents=True)
+        (context_dir / "lore_bible.md").write_text("LORE\n")
+        (context_dir / "world" / "b.md").write_text("W-B")
+        (context_dir / "world" / "a.md").write_text("W-A")
+        (context_dir / "style" / "tone.md").write_text("S-T")
+        (context_dir / "style" / "pace.md").write_text("S-P")
+        (context_dir / "locations" / "city.md").write_text("L")
+        for name in ("z.md", "m.md", "a.md"):
+            (context_dir / "characters" / name).write_text(f"C-{name}")
+        state = {
+            "selected_context": {
+                "location": "city.md",
+                "characters": ["z.md", "missing.md", "m.md", "a.md"],
+                "world_files": ["b.md", "a.md"],
+            }
+        }
+
+        vars_out = build_prompt_context_vars(context_dir, state)
+
+        assert vars_out == {
+            "lore_bible": "LORE" + loader_module.WORLD_FOLD_SEPARATOR + "W-A\n\nW-B",
+            "style_rules": "## pace\n\nS-P\n\n## tone\n\nS-T",
+            "location_context": "L",
+            "character_context": "## z.md\n\nC-z.md\n\n## m.md\n\nC-m.md\n\n"
+            "## a.md\n\nC-a.md",
+        }
+
+    def test_build_prompt_context_vars_normalizes_newlines(
+        self, tmp_path: Path
+    ) -> None:
+        """Binary reads keep text-mode newline translation (CRLF and CR)."""
+        context_dir = tmp_path / "context"
+        (context_dir / "characters").mkdir(parents=True)
+        (context_dir / "lore_bible.md").write_bytes(b"a\r\nb\rc\n")
+        (context_dir / "characters" / "x.md").write_bytes("\u00e9\r\n".encode())
+        state = {"selected_context": {"characters": ["x.md"]}}
+
+        vars_out = build_prompt_context_vars(context_dir, state)
+
+        assert vars_out["lore_bible"] == "a\nb\nc\n"
+        assert vars_out["character_context"] == "## x.md\n\n\u00e9\n"
+
+    def test_build_prompt_context_vars_read_error_is_context_error(
+        self, tmp_path: Path
+    ) -> None:
+        """An OSError from the batched read surfaces as ContextLoaderError."""
+        context_dir = tmp_path / "context"
+        (context_dir / "characters" / "x.md").mkdir(parents=True)
+        (context_dir / "lore_bible.md").write_text("LORE")
+        state = {"selected_context": {"characters": ["x.md"]}}
+
+        with pytest.raises(ContextLoaderError, match="Failed to read .*x.md"):
+            build_prompt_context_vars(context_dir, state)
+
+    def test_list_markdown_files_matches_glob(self, tmp_path: Path) -> None:
+        """The scandir listing returns the same entries as sorted(glob('*.md'))."""
+        for name in ("b.md", "a.md", ".hidden.md", "notes.txt", "md"):
+            (tmp_path / name).write_text("x")
+        (tmp_path / "dir.md").mkdir()
+
+        assert loader_module._list_markdown_files(tmp_path) == sorted(
+            tmp_path.glob("*.md")
+        )
+        assert loader_module._list_markdown_files(tmp_path / "missing") == []
+
 
 class TestContextLoaderAppConfigLimits:
     """Tests for context selection limits from app config (T005)."""
@@ -1,6 +1,7 @@
 """Tests for critic step."""
 
 import json
+import re
 from importlib import import_module
 from pathlib import Path
 from typing import Any
@@ -22,6 +23,9 @@ logging_module = import_module("llm_storytell.logging")
 execute_critic_step = critic_module.execute_critic_step
 CriticStepError = critic_module.CriticStepError
 _parse_two_block_response = critic_module._parse_two_block_response
+_split_frontmatter_fast = critic_module._split_frontmatter_fast
+_strip_frontmatter = critic_module._strip_frontmatter
+_load_all_sections = critic_module._load_all_sections
 LLMResult = llm_module.LLMResult
 LLMProvider = llm_module.LLMProvider
 LLMProviderError = llm_module.LLMProviderError
@@ -242,6 +246,133 @@ def valid_critic_response() -> str:
     )
 
 
+def _write_section(artifacts_dir: Path, num: int, body: str) -> Path:
+    """Write a section artifact with minimal valid frontmatter."""
+    path = artifacts_dir / f"20_section_{num:02d}.md"
+    path.write_text(f"---\nsection_id: {num}\n---\n{body}", encoding="utf-8")
+    return path
+
+
+class TestStripFrontmatter:
+    """Unit tests for frontmatter splitting."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\na: 1\n---\nBody\n",
+            "---\na: 1\n---   \n\n\nBody",
+            "---\na: 1\n----\nb: 2\n---\nBody",
+            "---\na: 1\n---x\n---\n---\nBody",
+            "---\na: 1\n---\n",
+            "---\na: 1\nno closing fence\n",
+            "---\na: 1\n\n---\n\n## Title\n",
+            "---\na: 1\n---\n \nBody",
+            "---\n",
+        ],
+    )
+    def test_fast_split_matches_regex(self, content: str) -> None:
+        """Character scan gives the same split as the original pattern."""
+        match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)$", content, re.DOTALL)
+        expected = (match.group(1), match.group(2)) if match else None
+        assert _split_frontmatter_fast(content) == expected
+
+    def test_leading_whitespace_fence_uses_pattern(self) -> None:
+        """Opening fence followed by extra whitespace still strips correctly."""
+        assert _strip_frontmatter("---  \n\na: 1\n---\nBody") == "Body"
+
+    def test_missing_frontmatter_raises(self) -> None:
+        """Content without fences raises CriticStepError."""
+        with pytest.raises(CriticStepError, match="missing valid YAML frontmatter"):
+            _strip_frontmatter("## Title\n\nBody\n")
+
+
+class TestLoadAllSections:
+    """Unit tests for reading and combining section artifacts."""
+
+    def test_returns_section_bodies_in_order(self, tmp_path: Path) -> None:
+        """Bodies are returned in section-number order."""
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        _write_section(artifacts_dir, 2, "Second.\n")
+        _write_section(artifacts_dir, 1, "First.\n")
+        assert _load_all_sections(tmp_path, 2) == ["First.\n", "Second.\n"]
+
+    def test_crlf_sections_are_normalized(self, tmp_path: Path) -> None:
+        """CRLF section files are read with text-mode newline handling."""
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        (artifacts_dir / "20_section_01.md").write_bytes(
+            b"---\r\nsection_id: 1\r\n---\r\nBody.\r\n"
+        )
+        assert _load_all_sections(tmp_path, 1) == ["Body.\n"]
+
+    @pytest.mark.parametrize(
+        ("names", "expected", "missing"),
+        [
+            (["01", "02", "03"], 3, None),
+            (["01", "02", "03", "04"], 3, None),  # extra sections are kept
+            (["1", "01", "03"], 3, "2"),  # duplicate number hides a gap
+            (["02", "03"], 3, "1"),
+            (["01", "03", "05"], 4, "2, 4"),
+        ],
+    )
+    def test_gap_check(
+        self, tmp_path: Path, names: list[str], expected: int, missing: str | None
+    ) -> None:
+        """Gaps in 1..expected are reported; duplicates and extras are not gaps."""
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        for name in names:
+            (artifacts_dir / f"20_section_{name}.md").write_text("---\na: 1\n---\nB")
+        if missing is None:
+            assert len(_load_all_sections(tmp_path, expected)) == len(names)
+        else:
+            with pytest.raises(
+                CriticStepError, match=f"Missing section indices: {missing}\\."
+            ):
+                _load_all_sections(tmp_path, expected)
+
+    def test_reports_all_broken_sections_at_once(self, tmp_path: Path) -> None:
+        """Every unreadable or unfenced section is listed in one error."""
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        _write_section(artifacts_dir, 1, "Fine.\n")
+        (artifacts_dir / "20_section_02.md").write_text("no frontmatter")
+        (artifacts_dir / "20_section_03.md").write_bytes(b"---\na: 1\n---\n\xff")
+
+        with pytest.raises(CriticStepError) as exc_info:
+            _load_all_sections(tmp_path, 3)
+
+        message = str(exc_info.value)
+        assert message.startswith("2 section artifacts could not be loaded:\n")
+        assert "- Error processing section 2 (20_section_02.md)" in message
+        assert (
+            "- Error reading section artifact 20_section_03.md (section 3)" in message
+        )
+        assert "Fine." not in message
+
+    def test_single_broken_section_keeps_plain_message(self, tmp_path: Path) -> None:
+        """One failure is reported as before, without a list wrapper."""
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        (artifacts_dir / "20_section_01.md").write_text("no frontmatter")
+
+        with pytest.raises(
+            CriticStepError, match=r"^Error processing section 1 \(20_section_01\.md\)"
+        ):
+            _load_all_sections(tmp_path, 1)
+
+    def test_ignores_non_section_entries(self, tmp_path: Path) -> None:
+        """Only regular files named 20_section_<digits>.md are picked up."""
+        artifacts_dir = tmp_path / "artifacts"
+        artifacts_dir.mkdir()
+        _write_section(artifacts_dir, 1, "Only.\n")
+        for name in ("20_section_.md", "20_section_+2.md", "20_section_02.txt"):
+            (artifacts_dir / name).write_text("---\na: 1\n---\nNo.\n")
+        (artifacts_dir / "20_section_03.md").mkdir()
+        assert _load_all_sections(tmp_path, 1) == ["Only.\n"]
+
+
 class TestParseTwoBlockResponse:
     """Unit tests for critic two-block parsing (including wrapped JSON)."""
 
@@ -274,6 +405,16 @@ class TestParseTwoBlockResponse:
         assert "# From markdown" in script
         assert "Wrong" not in script
 
+    def test_final_script_trailing_whitespace_trimmed(self) -> None:
+        """Trailing whitespace (including non-ASCII spaces) is trimmed like rstrip."""
+        report = {"issues_found": [], "changes_applied": []}
+        content = (
+            "===FINAL_SCRIPT===\n\n# Title\n\nLast line.\u3000\xa0 \n\n"
+            "===EDITOR_REPORT_JSON===\n" + json.dumps(report)
+        )
+        script, _ = _parse_two_block_response(content)
+        assert script == "# Title\n\nLast line."
+
     def test_flat_json_still_valid(self) -> None:
         """Bare issues_found / changes_applied object (original contract)."""
         body = {"issues_found": ["x"], "changes_applied": ["y"]}
@@ -378,6 +519,31 @@ class TestExecuteCriticStepSuccess:
         assert "This is the first section content" in prompt
         assert "This is the second section content" in prompt
 
+    def test_logs_written_artifact_sizes(
+        self,
+        temp_run_dir_with_sections: Path,
+        temp_context_dir: Path,
+        temp_prompts_dir: Path,
+        valid_critic_response: str,
+    ) -> None:
+        """Logged artifact sizes match the bytes on disk."""
+        provider = _MockLLMProvider(response_content=valid_critic_response)
+        logger = RunLogger(temp_run_dir_with_sections / "run.log")
+        execute_critic_step(
+            run_dir=temp_run_dir_with_sections,
+            context_dir=temp_context_dir,
+            prompts_dir=temp_prompts_dir,
+            llm_provider=provider,
+            logger=logger,
+            schema_base=SCHEMA_BASE,
+        )
+
+        log = (temp_run_dir_with_sections / "run.log").read_text(encoding="utf-8")
+        artifacts_dir = temp_run_dir_with_sections / "artifacts"
+        for name in ("final_script.md", "editor_report.json"):
+            size = (artifacts_dir / name).stat().st_size
+            assert f"Artifact written: artifacts/{name} ({size} bytes)" in log
+
     def test_loads_all_context_files(
         self,
         temp_run_dir_with_sections: Path,
@@ -4,6 +4,7 @@ import sys
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Mapping
+from unittest.mock import patch
 
 import pytest
 
@@ -76,7 +77,7 @@ class _FakeOpenAIClient:
 
         if self._failures_before_success > 0:
             self._failures_before_success -= 1
-            raise RuntimeError("temporary failure")
+            raise ConnectionError("temporary failure")
 
         if not self._responses:
             raise RuntimeError("no fake responses configured")
@@ -170,6 +171,30 @@ class TestOpenAIProviderSuccess:
         assert call_kwargs["temperature"] == 0.5
 
 
+class TestOpenAIProviderDefaultParams:
+    """Default generation parameters are read-only and merged per call."""
+
+    def test_default_params_are_read_only(self) -> None:
+        """Defaults are stored as a read-only mapping."""
+        provider = OpenAIProvider(
+            _FakeOpenAIClient(), default_model="gpt-4", temperature=0.1
+        )
+        with pytest.raises(TypeError):
+            provider._default_params["temperature"] = 0.9  # type: ignore[index]
+
+    def test_overrides_do_not_leak_into_defaults(self) -> None:
+        """A per-call override applies to that call only."""
+        response: Mapping[str, Any] = {"choices": [{"message": {"content": "ok"}}]}
+        client = _FakeOpenAIClient(responses=[dict(response), dict(response)])
+        provider = OpenAIProvider(client, default_model="gpt-4", temperature=0.1)
+
+        provider.generate("a", step="outline", temperature=0.9)
+        provider.generate("b", step="outline")
+
+        assert client.calls[0]["temperature"] == 0.9
+        assert client.calls[1]["temperature"] == 0.1
+
+
 class TestOpenAIProviderRetries:
     """Tests for retry behaviour."""
 
@@ -198,6 +223,7 @@ class TestOpenAIProviderRetries:
             client,
             default_model="gpt-4",
             max_retries=2,
+            retry_backoff=0.0,
         )
 
         result = provider.generate("Hi", step="outline")
@@ -226,6 +252,7 @@ class TestOpenAIProviderRetries:
             client,
             default_model="gpt-4",
             max_retries=1,
+            retry_backoff=0.0,
         )
 
         try:
@@ -238,10 +265,91 @@ class TestOpenAIProviderRetries:
         # Initial attempt + one retry
         assert len(client.calls) == 2
 
+    def test_non_transient_error_fails_without_retry(self) -> None:
+        """Exceptions outside retry_on raise immediately."""
+        calls: list[dict[str, Any]] = []
+
+        def client(**kwargs: Any) -> Mapping[str, Any]:
+            calls.append(kwargs)
+            raise KeyError("bad payload")
+
+        provider = OpenAIProvider(client, default_model="gpt-4", max_retries=2)
+
+        with pytest.raises(LLMProviderError, match="OpenAI call failed"):
+            provider.generate("Hi", step="outline")
+        assert len(calls) == 1
+
+    def test_custom_retry_on_is_retried(self) -> None:
+        """retry_on extends which exceptions count as transient."""
+        client = _FakeOpenAIClient(
+            responses=[{"choices": [{"message": {"content": "ok"}}]}]
+        )
+        client.fail_n_times(1)
+        provider = OpenAIProvider(
+            client,
+            default_model="gpt-4",
+            retry_on=(ConnectionError,),
+            retry_backoff=0.0,
+        )
+
+        assert provider.generate("Hi", step="outline").content == "ok"
+        assert len(client.calls) == 2
+
+    def test_backoff_sleeps_between_attempts(self) -> None:
+        """Retries sleep with exponential backoff plus bounded jitter."""
+        client = _FakeOpenAIClient(
+            responses=[{"choices": [{"message": {"content": "ok"}}]}]
+        )
+        client.fail_n_times(2)
+        provider = OpenAIProvider(
+            client, default_model="gpt-4", max_retries=2, retry_backoff=0.5
+        )
+
+        with patch.object(llm_module.time, "sleep") as sleep:
+            provider.generate("Hi", step="outline")
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert len(delays) == 2
+        assert 0.5 <= delays[0] <= 0.75
+        assert 1.0 <= delays[1] <= 1.25
+
 
 class TestOpenAIProviderUsageExtraction:
     """Tests around token usage extraction logic."""
 
+    def test_fast_extraction_matches_defensive_path(self) -> None:
+        """Fast path returns the same tuple as _extract_response."""
+        response: Mapping[str, Any] = {
+            "choices": [{"message": {"content": "Text"}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3},
+        }
+        fast = OpenAIProvider._extract_response_fast(response)
+        assert fast == ("Text", 1, 2, 3)
+        assert fast == OpenAIProvider._extract_response(response)
+
+    def test_fast_extraction_defers_on_incomplete_shape(self) -> None:
+        """Fast path returns None for missing usage, blank or non-str content."""
+        assert (
+            OpenAIProvider._extract_response_fast(
+                {"choices": [{"message": {"content": "x"}}]}
+            )
+            is None
+        )
+        assert (
+            OpenAIProvider._extract_response_fast(
+                {
+                    "choices": [{"message": {"content": "  "}}],
+                    "usage": {
+                        "prompt_tokens": 1,
+                        "completion_tokens": 1,
+                        "total_tokens": 2,
+                    },
+                }
+            )
+            is None
+        )
+        assert OpenAIProvider._extract_response_fast({"choices": []}) is None
+
     def test_total_tokens_can_be_derived(self) -> None:
         """total_tokens is derived when missing but components present."""
         response: Mapping[str, Any] = {
@@ -1,8 +1,11 @@
 """Tests for logging functionality."""
 
+import io
+from datetime import datetime, timezone
 from importlib import import_module
 from pathlib import Path
 import sys
+from unittest.mock import patch
 
 # Import from the package using the hyphenated name
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -15,9 +18,83 @@ TokenUsage = token_tracking_module.TokenUsage
 record_token_usage = token_tracking_module.record_token_usage
 
 
+class TestRunLoggerTimestamp:
+    """Tests for RunLogger timestamp formatting."""
+
+    def test_timestamp_is_iso_utc_seconds(self, tmp_path: Path) -> None:
+        """Timestamp matches datetime.isoformat(timespec='seconds') in UTC."""
+        logger = RunLogger(tmp_path / "test.log")
+        with patch.object(logging_module.time, "time", return_value=1700000000.7):
+            stamp = logger._timestamp()
+        expected = datetime.fromtimestamp(1700000000, timezone.utc).isoformat(
+            timespec="seconds"
+        )
+        assert stamp == expected == "2023-11-14T22:13:20+00:00"
+
+    def test_timestamp_changes_with_second(self, tmp_path: Path) -> None:
+        """Cached timestamp is refreshed when the second changes."""
+        logger = RunLogger(tmp_path / "test.log")
+        with patch.object(
+            logging_module.time, "time", side_effect=[100.1, 100.9, 101.0]
+        ):
+            first = logger._timestamp()
+            second = logger._timestamp()
+            third = logger._timestamp()
+        assert first == second
+        assert third != first
+        assert third.endswith("00:01:41+00:00")
+
+
+class TestRunLoggerFileHandle:
+    """Tests for RunLogger's per-write file access."""
+
+    def test_entries_visible_immediately_and_no_handle_held(
+        self, tmp_path: Path
+    ) -> None:
+        """Each entry is on disk right away; the logger keeps no open file."""
+        log_path = tmp_path / "test.log"
+        logger = RunLogger(log_path)
+        logger.info("first")
+        assert "first" in log_path.read_text()
+        assert not any(isinstance(value, io.IOBase) for value in vars(logger).values())
+
+    def test_interleaves_with_other_appenders(self, tmp_path: Path) -> None:
+        """Entries stay ordered with direct appends to the same file."""
+        log_path = tmp_path / "test.log"
+        logger = RunLogger(log_path)
+        logger.info("one")
+        with log_path.open("a", encoding="utf-8") as f:
+            f.write("two\n")
+        logger.info("three")
+        lines = log_path.read_text().splitlines()
+        assert [line.rsplit(" ", 1)[-1] for line in lines] == ["one", "two", "three"]
+
+
 class TestRunLoggerStructuredEvents:
     """Tests for structured log events."""
 
+    def test_log_run_init_writes_four_entries_with_one_timestamp(
+        self, tmp_path: Path
+    ) -> None:
+        """log_run_init writes its four INFO lines sharing a timestamp."""
+        log_path = tmp_path / "test.log"
+        logger = RunLogger(log_path)
+        logger.log_run_init(
+            app_name="app",
+            seed="A seed.",
+            context_dir=Path("ctx"),
+            prompts_dir=Path("prm"),
+        )
+
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 4
+        assert len({line.split("]", 1)[0] for line in lines}) == 1
+        assert all("[INFO]" in line for line in lines)
+        assert lines[0].endswith("Run initialized for app: app")
+        assert lines[1].endswith("Seed: A seed.")
+        assert lines[2].endswith(f"Context directory: {Path('ctx')}")
+        assert lines[3].endswith(f"Prompts directory: {Path('prm')}")
+
     def test_log_stage_start(self, tmp_path: Path) -> None:
         """log_stage_start writes stage start entry."""
         log_path = tmp_path / "test.log"
@@ -218,6 +295,30 @@ class TestTokenTracking:
         assert result["prompt_tokens"] == 150
         assert result["completion_tokens"] == 200
 
+    def test_record_token_usage_cumulative_from_state(self, tmp_path: Path) -> None:
+        """Cumulative totals come from the passed state, else from state.json."""
+        (tmp_path / "state.json").write_text(
+            '{"token_usage": [{"prompt_tokens": 1, "completion_tokens": 2, '
+            '"total_tokens": 3}]}'
+        )
+        kwargs = {"step": "s", "provider": "p", "model": "m"}
+        logger = RunLogger(tmp_path / "run.log")
+        record_token_usage(logger, prompt_tokens=10, completion_tokens=20, **kwargs)
+        state = {"token_usage": [{"prompt_tokens": 5, "completion_tokens": 5}]}
+        record_token_usage(
+            logger, prompt_tokens=10, completion_tokens=20, state=state, **kwargs
+        )
+
+        lines = (tmp_path / "run.log").read_text().splitlines()
+        assert [line.split("] ", 2)[2] for line in lines] == [
+            "Token usage: prompt_tokens=10, completion_tokens=20, total_tokens=30",
+            "Cumulative token usage: prompt_tokens=11, completion_tokens=22, "
+            "total_tokens=33",
+            "Token usage: prompt_tokens=10, completion_tokens=20, total_tokens=30",
+            "Cumulative token usage: prompt_tokens=15, completion_tokens=25, "
+            "total_tokens=30",
+        ]
+
     def test_token_usage_visible_in_mocked_tests(self, tmp_path: Path) -> None:
         """Token usage can be recorded even when LLM calls are mocked."""
         log_path = tmp_path / "test.log"
@@ -297,3 +398,14 @@ class TestNoSecretsLogged:
         assert "api_key" not in content.lower()
         assert "secret" not in content.lower()
         assert "password" not in content.lower()
+
+
+def test_importing_logging_does_not_import_datetime() -> None:
+    """logging.py formats timestamps from time.gmtime; datetime stays unloaded."""
+    import subprocess
+
+    code = "import sys, llm_storytell.logging; print('datetime' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
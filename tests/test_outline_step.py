@@ -486,16 +486,18 @@ class TestExecuteOutlineStepErrors:
         assert state["outline"] == []
         assert state["token_usage"] == []
 
+    @pytest.mark.parametrize("beats", [25, 0, True, 3.0, "3"])
     def test_fails_on_invalid_beats_count(
         self,
         temp_run_dir: Path,
         temp_context_dir: Path,
         temp_prompts_dir: Path,
+        beats: object,
     ) -> None:
-        """Fails if beats count is invalid."""
+        """Fails if beats count is out of range or not an int (bools included)."""
         with (temp_run_dir / "inputs.json").open("r", encoding="utf-8") as f:
             inputs = json.load(f)
-        inputs["beats"] = 25  # Invalid: > 20
+        inputs["beats"] = beats
         with (temp_run_dir / "inputs.json").open("w", encoding="utf-8") as f:
             json.dump(inputs, f)
 
@@ -617,10 +619,8 @@ class TestExecuteOutlineStepErrors:
         temp_prompts_dir: Path,
     ) -> None:
         """Fails if outline doesn't match schema."""
-        # Invalid outline: missing required fields
-        invalid_outline = json.dumps(
-            {"beats": [{"beat_id": 1}]}
-        )  # Missing title and summary
+        # Invalid outline: right beat count, but beats miss title and summary
+        invalid_outline = json.dumps({"beats": [{"beat_id": i} for i in range(1, 6)]})
         provider = _MockLLMProvider(response_content=invalid_outline)
 
         logger = RunLogger(temp_run_dir / "run.log")
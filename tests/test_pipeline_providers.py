@@ -11,6 +11,7 @@ import pytest
 from llm_storytell.llm import ClaudeProvider
 from llm_storytell.pipeline.providers import (
     ProviderError,
+    _load_creds_api_key,
     create_llm_provider,
     create_tts_provider,
 )
@@ -114,3 +115,22 @@ class TestCreateTTSProviderUnsupported:
             create_tts_provider(tmp_path, {"tts_provider": "unknown"})
         assert "Unsupported TTS provider" in str(exc_info.value)
         assert "unknown" in str(exc_info.value)
+
+
+class TestLoadCredsKeys:
+    """API key lookup in creds.json."""
+
+    def test_first_non_empty_name_wins(self, tmp_path: Path) -> None:
+        (tmp_path / "creds.json").write_text(
+            json.dumps({"openai_api_key": "", "OPEN_AI": "k2", "OPENAI_API_KEY": "k3"}),
+            encoding="utf-8",
+        )
+        assert _load_creds_api_key(tmp_path) == "k2"
+
+    @pytest.mark.parametrize("content", [None, "not json", "[1, 2]", "{}"])
+    def test_missing_or_invalid_creds_return_none(
+        self, tmp_path: Path, content: str | None
+    ) -> None:
+        if content is not None:
+            (tmp_path / "creds.json").write_text(content, encoding="utf-8")
+        assert _load_creds_api_key(tmp_path) is None
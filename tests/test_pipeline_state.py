@@ -1,7 +1,9 @@
-"""Tests for pipeline state IO: load_state, load_inputs, update_state_atomic."""
+"""Tests for pipeline state IO: load_state, load_inputs, update_state_atomic, write_atomic."""
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -11,6 +13,7 @@ from llm_storytell.pipeline.state import (
     load_state,
     update_state_atomic,
     update_state_selected_context,
+    write_atomic,
 )
 
 
@@ -72,6 +75,18 @@ def test_load_inputs_invalid_json(tmp_path: Path) -> None:
         load_inputs(run_dir)
 
 
+def test_load_state_reads_utf8_bytes(tmp_path: Path) -> None:
+    """load_state decodes UTF-8 (with or without a BOM) from the raw bytes."""
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    payload = json.dumps({"seed": "caf\u00e9"}, ensure_ascii=False).encode("utf-8")
+    (run_dir / "state.json").write_bytes(payload)
+    assert load_state(run_dir) == {"seed": "caf\u00e9"}
+
+    (run_dir / "state.json").write_bytes(b"\xef\xbb\xbf" + payload)
+    assert load_state(run_dir) == {"seed": "caf\u00e9"}
+
+
 def test_update_state_atomic_success(tmp_path: Path) -> None:
     """update_state_atomic applies updater and writes state atomically."""
     run_dir = tmp_path / "run"
@@ -106,6 +121,62 @@ def test_update_state_atomic_missing_state_raises(tmp_path: Path) -> None:
         update_state_atomic(run_dir, updater)
 
 
+def test_update_state_atomic_with_loaded_state_skips_reread(tmp_path: Path) -> None:
+    """A preloaded state is updated in place and written without re-reading."""
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    state_path = run_dir / "state.json"
+    state_path.write_text(json.dumps({"key": "old"}), encoding="utf-8")
+    state = load_state(run_dir)
+    # On-disk content changes are not picked up: the passed state wins
+    state_path.write_text("not json [", encoding="utf-8")
+
+    def updater(s: dict) -> None:
+        s["key"] = "new"
+
+    update_state_atomic(run_dir, updater, state=state)
+
+    assert state == {"key": "new"}
+    assert load_state(run_dir) == {"key": "new"}
+    assert len(list(run_dir.glob("*.tmp"))) == 0
+
+
+def test_write_atomic_writes_str_and_bytes(tmp_path: Path) -> None:
+    """write_atomic replaces the target with UTF-8 text or raw bytes."""
+    target = tmp_path / "out.md"
+    target.write_text("old", encoding="utf-8")
+
+    assert write_atomic(target, "caf\u00e9\n", fsync=True) == 6
+    assert target.read_bytes() == "caf\u00e9\n".encode()
+
+    assert write_atomic(target, b"\x00raw") == 4
+    assert target.read_bytes() == b"\x00raw"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_write_atomic_fsync_flushes_file_and_directory(tmp_path: Path) -> None:
+    """With fsync=True the temp file and, on POSIX, the directory are synced."""
+    target = tmp_path / "out.md"
+    with patch("llm_storytell.pipeline.state.os.fsync") as fsync:
+        write_atomic(target, "x")
+        assert fsync.call_count == 0
+        write_atomic(target, "x", fsync=True)
+    assert fsync.call_count == (2 if hasattr(os, "O_DIRECTORY") else 1)
+
+
+def test_write_atomic_failure_keeps_target_and_cleans_up(tmp_path: Path) -> None:
+    """If the rename fails, the target is untouched and no temp file remains."""
+    target = tmp_path / "out.md"
+    target.write_text("old", encoding="utf-8")
+
+    with patch("llm_storytell.pipeline.state.os.replace", side_effect=OSError("boom")):
+        with pytest.raises(OSError, match="boom"):
+            write_atomic(target, "new")
+
+    assert target.read_text(encoding="utf-8") == "old"
+    assert [p for p in os.listdir(tmp_path) if p != "out.md"] == []
+
+
 def test_update_state_selected_context_uses_atomic(tmp_path: Path) -> None:
     """update_state_selected_context updates selected_context via atomic write."""
     run_dir = tmp_path / "run"
@@ -119,3 +190,27 @@ def test_update_state_selected_context_uses_atomic(tmp_path: Path) -> None:
     update_state_selected_context(run_dir, selected)
     state = load_state(run_dir)
     assert state["selected_context"] == selected
+
+
+def test_importing_state_does_not_import_runner() -> None:
+    """The pipeline package resolves re-exports lazily, so state stays light."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, llm_storytell.pipeline.state; "
+        "print('llm_storytell.pipeline.runner' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_pipeline_package_reexports_resolve_lazily() -> None:
+    """Names in pipeline.__all__ are still importable from the package."""
+    import llm_storytell.pipeline as pipeline_pkg
+
+    assert pipeline_pkg.update_state_selected_context is update_state_selected_context
+    with pytest.raises(AttributeError):
+        pipeline_pkg.not_a_real_name  # noqa: B018
@@ -0,0 +1,84 @@
+"""Tests for JSON schema validation."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from llm_storytell.schemas import (
+    SchemaValidationError,
+    _find_project_root,
+    default_schema_base,
+    load_schema,
+    validate_json_schema,
+)
+
+SCHEMA = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {"name": {"type": "string"}},
+}
+
+
+def _write_schema(path: Path, schema: dict) -> Path:
+    path.write_text(json.dumps(schema), encoding="utf-8")
+    return path
+
+
+def test_valid_data_passes(tmp_path: Path) -> None:
+    """Data matching the schema validates without error."""
+    schema_path = _write_schema(tmp_path / "s.json", SCHEMA)
+    validate_json_schema({"name": "x"}, schema_path)
+
+
+def test_invalid_data_reports_message_and_path(tmp_path: Path) -> None:
+    """The best-matching error is reported with its path."""
+    schema_path = _write_schema(tmp_path / "s.json", SCHEMA)
+    with pytest.raises(
+        SchemaValidationError, match=r"is not of type 'string' \(at path: name\)"
+    ):
+        validate_json_schema({"name": 1}, schema_path)
+
+
+def test_missing_schema_raises_file_not_found(tmp_path: Path) -> None:
+    """A missing schema file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError, match="Schema file not found"):
+        validate_json_schema({}, tmp_path / "missing.json")
+
+
+def test_invalid_schema_raises(tmp_path: Path) -> None:
+    """Schema JSON errors and invalid schemas are reported."""
+    schema_path = tmp_path / "s.json"
+    schema_path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(SchemaValidationError, match="Invalid JSON in schema file"):
+        validate_json_schema({}, schema_path)
+
+    _write_schema(schema_path, {"type": 5})
+    with pytest.raises(SchemaValidationError, match="Invalid schema in"):
+        validate_json_schema({}, schema_path)
+
+
+def test_load_schema_returns_document(tmp_path: Path) -> None:
+    """load_schema returns the parsed schema; a missing file is reported."""
+    schema_path = _write_schema(tmp_path / "s.json", SCHEMA)
+
+    assert load_schema(schema_path) == SCHEMA
+    with pytest.raises(FileNotFoundError, match="Schema file not found"):
+        load_schema(tmp_path / "missing.json")
+
+
+def test_find_project_root_finds_nearest_marker(tmp_path: Path) -> None:
+    """The nearest directory with SPEC.md or pyproject.toml wins."""
+    root = tmp_path / "proj"
+    nested = root / "a" / "b"
+    nested.mkdir(parents=True)
+    (root / "pyproject.toml").touch()
+
+    assert _find_project_root(nested) == root
+    (nested / "SPEC.md").touch()
+    assert _find_project_root(nested) == nested
+
+
+def test_default_schema_base_is_repo_schemas_dir() -> None:
+    """From inside the repository, the default base holds the shipped schemas."""
+    assert (default_schema_base() / "outline.schema.json").is_file()
@@ -319,6 +319,7 @@ class TestContinuityFunctions:
         assert result["key1"] == "value1"
         assert result["key2"] == "new_value2"
         assert result["key3"] == "value3"
+        assert result is ledger
 
     def test_get_continuity_context(self) -> None:
         """Formats continuity ledger for prompt inclusion."""
@@ -664,7 +665,7 @@ class TestSectionLoopIntegration:
             # Summarize section
             summary_json = valid_summary_json.replace(
                 '"section_id": 1', f'"section_id": {i + 1}'
-            )
+            ).replace("The worker wakes", f"Recap {i + 1}. The worker wakes")
             provider.set_response(summary_json)
             provider.set_failure(False)
 
@@ -691,6 +692,15 @@ class TestSectionLoopIntegration:
         assert len(state["summaries"]) == 3
         assert len(state["token_usage"]) == 6  # 3 sections + 3 summaries
 
+        # Each section prompt carries the summary of the section before it,
+        # so summarize(i) must finish before section(i + 1) starts.
+        section_prompts = [
+            c["prompt"] for c in provider.calls if c["step"].startswith("section")
+        ]
+        assert "Recap 1." not in section_prompts[0]
+        assert "Recap 1." in section_prompts[1]
+        assert "Recap 2." in section_prompts[2]
+
 
 class TestSectionStepErrors:
     """Tests for section step error handling."""